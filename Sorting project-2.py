@@ -1,182 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import os
+import queue
 import random
+import signal
 import time
+import multiprocessing
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-class SortingAlgorithms:
-    #class containing all sorting algorithm implementations
-    
-    @staticmethod
-    def bubble_sort(arr):
-        # bubble sort implementation with adjacent element comparison and swapping
-        n = len(arr)
-        for i in range(n):
-            for j in range(n-i-1):
-                if arr[j] > arr[j+1]:
-                    arr[j], arr[j+1] = arr[j+1], arr[j]
-        return arr
-
-    @staticmethod
-    def insertion_sort(arr):
-        # insertion sort that builds sorted array one element at a time
-        for i in range(1, len(arr)):
-            key = arr[i]
-            j = i-1
-            while j >= 0 and arr[j] > key:
-                arr[j+1] = arr[j]
-                j -= 1
-            arr[j+1] = key
-        return arr
-
-    @staticmethod
-    def merge_sort(arr):
-        # merge sort using divide and conquer approach
-        if len(arr) > 1:
-            mid = len(arr)//2
-            left = arr[:mid]
-            right = arr[mid:]
-            SortingAlgorithms.merge_sort(left)
-            SortingAlgorithms.merge_sort(right)
-            i = j = k = 0
-            while i < len(left) and j < len(right):
-                if left[i] < right[j]:
-                    arr[k] = left[i]
-                    i += 1
-                else:
-                    arr[k] = right[j]
-                    j += 1
-                k += 1
-            while i < len(left):
-                arr[k] = left[i]
-                i += 1
-                k += 1
-            while j < len(right):
-                arr[k] = right[j]
-                j += 1
-                k += 1
-        return arr
-
-    @staticmethod
-    def quick_sort(arr):
-        # quick sort with middle element as pivot
-        if len(arr) <= 1:
-            return arr
-        pivot = arr[len(arr)//2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
-        return SortingAlgorithms.quick_sort(left) + middle + SortingAlgorithms.quick_sort(right)
+import benchmarks
+import history
+from timing import DEFAULT_WARMUP
+from workloads import DISTRIBUTIONS
+from datasets import DatasetCache, DEFAULT_CACHE_SEED
+from algorithms import (SortingAlgorithms, SORT_ALGORITHMS, SELECTION_ALGORITHMS, LinkedList,
+                        SkipList, BinarySearchTree, ChainingHashTable, LinearProbingHashTable, DoubleHashingHashTable)
 
-    @staticmethod
-    def counting_sort(arr):
-        # counting sort for integer lists with known range
-        if not arr:
-            return arr
-        max_val = max(arr)
-        min_val = min(arr)
-        count = [0] * (max_val - min_val + 1)
-        for num in arr:
-            count[num - min_val] += 1
-        sorted_arr = []
-        for i in range(len(count)):
-            sorted_arr.extend([i + min_val] * count[i])
-        return sorted_arr
+# how often the GUI polls a running benchmark for messages, in milliseconds
+BENCHMARK_POLL_MS = 100
+# how long a cancelled benchmark may take to stop on its own before it is killed
+CANCEL_GRACE_MS = 5000
+# linked list tab: sort by relinking the nodes with LinkedList.sort instead of an array round trip
+IN_PLACE_LINKED_LIST_SORT = "In-place Merge Sort"
+# skip list queries offered on the linked list tab, each one a SkipList method taking a value
+SKIP_LIST_QUERIES = ["search", "floor", "ceiling", "predecessor", "successor"]
+# values shown for a skip list range query
+SKIP_LIST_RANGE_SHOWN = 50
 
-class LinkedList:
-    #class implementing singly linked list functionality
-    
-    class Node:
-        # nested class for linked list nodes
-        def __init__(self, data):
-            self.data = data
-            self.next = None
-    
-    def __init__(self):
-        # initialize empty linked list
-        self.head = None
-        self.size = 0
-    
-    def insert_at_head(self, data):
-        # insert new node at the beginning of the list
-        new_node = self.Node(data)
-        new_node.next = self.head
-        self.head = new_node
-        self.size += 1
-    
-    def load_from_file(self, filename):
-        # load list data from file (one number per line)
-        try:
-            with open(filename, 'r') as file:
-                for line in file:
-                    self.insert_at_head(int(line.strip()))
-            return True
-        except Exception as e:
-            print(f"error loading file: {e}")
-            return False
-    
-    def minimum(self):
-        # find minimum value in the list
-        if not self.head:
-            return None
-        current = self.head
-        min_val = current.data
-        while current:
-            if current.data < min_val:
-                min_val = current.data
-            current = current.next
-        return min_val
-    
-    def maximum(self):
-        # find maximum value in the list
-        if not self.head:
-            return None
-        current = self.head
-        max_val = current.data
-        while current:
-            if current.data > max_val:
-                max_val = current.data
-            current = current.next
-        return max_val
-    
-    def search(self, value):
-        # search for value in the list
-        current = self.head
-        while current:
-            if current.data == value:
-                return current
-            current = current.next
-        return None
-    
-    def predecessor(self, value):
-        # find predecessor of given value
-        if not self.head or self.head.data == value:
-            return None
-        prev = None
-        current = self.head
-        while current and current.data != value:
-            prev = current
-            current = current.next
-        if not current:
-            return None
-        return prev.data if prev else None
-    
-    def successor(self, value):
-        # find successor of given value
-        node = self.search(value)
-        if not node or not node.next:
-            return None
-        return node.next.data
-    
-    def to_list(self):
-        # convert linked list to python list
-        result = []
-        current = self.head
-        while current:
-            result.append(current.data)
-            current = current.next
-        return result
 class AlgorithmPlatform:
     #main application class for the algorithm platform
     
@@ -186,8 +37,12 @@ class AlgorithmPlatform:
         self.root.title("Algorithm Platform")
         self.root.geometry("900x700")
         self.linked_list = LinkedList()  # create linked list instance
+        self.skip_list = SkipList()  # sorted index built from the linked list
         self.bst = BinarySearchTree()  # create BST instance
+        self.job = None  # running background benchmark, if any
+        self.last_results = None  # result document currently plotted on the performance chart
         self.setup_interface()  # this calls create_bst_tab() which needs self.bst
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def setup_interface(self):
         # set up the main interface components
@@ -218,9 +73,7 @@ class AlgorithmPlatform:
         algo_frame.pack(fill=tk.X, padx=10, pady=5)
         
         self.sort_algo = tk.StringVar(value="Bubble Sort")
-        algorithms = ["Bubble Sort", "Insertion Sort", "Merge Sort", "Quick Sort", "Counting Sort"]
-        
-        for algo in algorithms:
+        for algo in SORT_ALGORITHMS:
             ttk.Radiobutton(algo_frame, text=algo, variable=self.sort_algo, value=algo).pack(anchor=tk.W)
         
         # input section
@@ -245,6 +98,36 @@ class AlgorithmPlatform:
         
         ttk.Button(button_frame, text="sort", command=self.run_sort).pack(side=tk.LEFT)
         ttk.Button(button_frame, text="clear", command=self.clear_results).pack(side=tk.LEFT)
+        self.sort_reverse = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="descending", variable=self.sort_reverse).pack(side=tk.LEFT, padx=5)
+        
+        # selection section
+        selection_frame = ttk.LabelFrame(tab, text="selection / top-k", padding=10)
+        selection_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        ttk.Label(selection_frame, text="k:").pack(side=tk.LEFT)
+        self.k_entry = ttk.Entry(selection_frame, width=8)
+        self.k_entry.pack(side=tk.LEFT, padx=5)
+        self.k_entry.insert(0, "3")
+        
+        for operation in SELECTION_ALGORITHMS:
+            ttk.Button(selection_frame, text=operation.lower(),
+                       command=lambda op=operation: self.run_selection(op)).pack(side=tk.LEFT, padx=2)
+        
+        # external sort section
+        external_frame = ttk.LabelFrame(tab, text="sort file to file (external merge sort)", padding=10)
+        external_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        ttk.Label(external_frame, text="memory budget (MB):").pack(side=tk.LEFT)
+        self.memory_budget_entry = ttk.Entry(external_frame, width=8)
+        self.memory_budget_entry.pack(side=tk.LEFT, padx=5)
+        self.memory_budget_entry.insert(0, str(SortingAlgorithms.EXTERNAL_SORT_DEFAULT_BUDGET // (1024 * 1024)))
+        
+        ttk.Label(external_frame, text="temp directory:").pack(side=tk.LEFT)
+        self.temp_dir_entry = ttk.Entry(external_frame)
+        self.temp_dir_entry.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5)
+        
+        ttk.Button(external_frame, text="sort file", command=self.run_external_sort).pack(side=tk.LEFT)
     
     def create_performance_tab(self):
         # create performance testing tab
@@ -268,24 +151,117 @@ class AlgorithmPlatform:
         self.runs_entry.pack(fill=tk.X, pady=5)
         self.runs_entry.insert(0, "10")
         
+        ttk.Label(settings_frame, text="warmup runs:").pack(anchor=tk.W)
+        self.warmup_entry = ttk.Entry(settings_frame)
+        self.warmup_entry.pack(fill=tk.X, pady=5)
+        self.warmup_entry.insert(0, str(DEFAULT_WARMUP))
+        
+        ttk.Label(settings_frame, text="time budget per cell in seconds (empty for none):").pack(anchor=tk.W)
+        self.budget_entry = ttk.Entry(settings_frame)
+        self.budget_entry.pack(fill=tk.X, pady=5)
+        self.budget_entry.insert(0, "10")
+        
+        jobs_frame = ttk.Frame(settings_frame)
+        jobs_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(jobs_frame, text="benchmark processes:").pack(side=tk.LEFT)
+        self.jobs_entry = ttk.Entry(jobs_frame, width=6)
+        self.jobs_entry.pack(side=tk.LEFT, padx=5)
+        self.jobs_entry.insert(0, "1")
+        self.isolate = tk.BooleanVar(value=False)
+        ttk.Checkbutton(jobs_frame, text="one process per algorithm", variable=self.isolate).pack(side=tk.LEFT, padx=5)
+        self.pin_cpus = tk.BooleanVar(value=False)
+        ttk.Checkbutton(jobs_frame, text="pin processes to cpus", variable=self.pin_cpus).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(settings_frame, text="parallel merge sort workers (comma separated):").pack(anchor=tk.W)
+        self.workers_entry = ttk.Entry(settings_frame)
+        self.workers_entry.pack(fill=tk.X, pady=5)
+        self.workers_entry.insert(0, ",".join(str(w) for w in (1, 2, 4, 8) if w <= (os.cpu_count() or 1)))
+        
         ttk.Label(settings_frame, text="select algorithms to test:").pack(anchor=tk.W)
         
-        self.algo_vars = {
-            "Bubble Sort": tk.BooleanVar(value=True),
-            "Insertion Sort": tk.BooleanVar(value=True),
-            "Merge Sort": tk.BooleanVar(value=True),
-            "Quick Sort": tk.BooleanVar(value=True),
-            "Counting Sort": tk.BooleanVar(value=True)
-        }
+        self.algo_vars = {algo: tk.BooleanVar(value=True) for algo in benchmarks.SORT_BENCHMARK_ALGORITHMS}
         
         algo_frame = ttk.Frame(settings_frame)
         algo_frame.pack(fill=tk.X)
         
-        for algo, var in self.algo_vars.items():
-            ttk.Checkbutton(algo_frame, text=algo, variable=var).pack(side=tk.LEFT, padx=5)
+        for i, (algo, var) in enumerate(self.algo_vars.items()):
+            ttk.Checkbutton(algo_frame, text=algo, variable=var).grid(row=i // 4, column=i % 4, sticky=tk.W, padx=5)
+        
+        selection_frame = ttk.Frame(settings_frame)
+        selection_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(selection_frame, text="selection, k =").pack(side=tk.LEFT)
+        self.perf_k_entry = ttk.Entry(selection_frame, width=8)
+        self.perf_k_entry.pack(side=tk.LEFT, padx=5)
+        self.perf_k_entry.insert(0, "100")
+        
+        self.selection_vars = {op: tk.BooleanVar(value=False) for op in SELECTION_ALGORITHMS}
+        for op, var in self.selection_vars.items():
+            ttk.Checkbutton(selection_frame, text=op, variable=var).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(settings_frame, text="input distributions:").pack(anchor=tk.W)
+        
+        self.distribution_vars = {dist: tk.BooleanVar(value=dist == "uniform") for dist in DISTRIBUTIONS}
+        
+        distribution_frame = ttk.Frame(settings_frame)
+        distribution_frame.pack(fill=tk.X)
+        
+        for i, (dist, var) in enumerate(self.distribution_vars.items()):
+            ttk.Checkbutton(distribution_frame, text=dist, variable=var).grid(row=i // 5, column=i % 5, sticky=tk.W, padx=5)
+        
+        seed_frame = ttk.Frame(settings_frame)
+        seed_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(seed_frame, text="seed (empty for random unless cached):").pack(side=tk.LEFT)
+        self.seed_entry = ttk.Entry(seed_frame, width=12)
+        self.seed_entry.insert(0, str(DEFAULT_CACHE_SEED))
+        self.seed_entry.pack(side=tk.LEFT, padx=5)
+        self.cache_datasets = tk.BooleanVar(value=True)
+        ttk.Checkbutton(seed_frame, text="cache inputs on disk", variable=self.cache_datasets).pack(side=tk.LEFT, padx=5)
+        ttk.Button(seed_frame, text="clear input cache", command=self.clear_dataset_cache).pack(side=tk.LEFT)
+        
+        self.count_ops = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="count operations (comparisons, writes, allocations, depth)",
+                        variable=self.count_ops).pack(anchor=tk.W)
+        self.plot_counts = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="plot comparisons against n log n and n\u00b2",
+                        variable=self.plot_counts).pack(anchor=tk.W)
+        self.measure_memory = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="measure peak memory (tracemalloc)",
+                        variable=self.measure_memory).pack(anchor=tk.W)
+        self.sort_buffers = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_frame, text="sort typed array('q') buffers in place instead of list copies",
+                        variable=self.sort_buffers).pack(anchor=tk.W)
         
         ttk.Button(settings_frame, text="run performance test", command=self.run_performance_test).pack(pady=10)
         
+        batch_frame = ttk.Frame(settings_frame)
+        batch_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        ttk.Label(batch_frame, text="batch sorting, list lengths:").pack(side=tk.LEFT)
+        self.batch_lengths_entry = ttk.Entry(batch_frame, width=14)
+        self.batch_lengths_entry.pack(side=tk.LEFT, padx=5)
+        self.batch_lengths_entry.insert(0, "8,16,32,64")
+        ttk.Label(batch_frame, text="lists per batch:").pack(side=tk.LEFT)
+        self.batch_lists_entry = ttk.Entry(batch_frame, width=8)
+        self.batch_lists_entry.pack(side=tk.LEFT, padx=5)
+        self.batch_lists_entry.insert(0, str(benchmarks.BATCH_LISTS))
+        ttk.Button(batch_frame, text="run batch test", command=self.run_batch_performance_test).pack(side=tk.LEFT)
+        
+        baseline_frame = ttk.Frame(settings_frame)
+        baseline_frame.pack(fill=tk.X)
+        
+        ttk.Label(baseline_frame, text="baseline run:").pack(side=tk.LEFT)
+        self.baseline_combo = ttk.Combobox(baseline_frame, state="readonly", width=60,
+                                           postcommand=self.refresh_baseline_runs)
+        self.baseline_combo.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        ttk.Label(baseline_frame, text="threshold:").pack(side=tk.LEFT)
+        self.threshold_entry = ttk.Entry(baseline_frame, width=6)
+        self.threshold_entry.pack(side=tk.LEFT, padx=5)
+        self.threshold_entry.insert(0, str(history.DEFAULT_THRESHOLD))
+        ttk.Button(baseline_frame, text="compare with baseline", command=self.compare_with_baseline).pack(side=tk.LEFT)
+        
         # results frame
         results_frame = ttk.LabelFrame(main_frame, text="test results", padding=10)
         results_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
@@ -293,6 +269,8 @@ class AlgorithmPlatform:
         main_frame.grid_rowconfigure(1, weight=1)
         main_frame.grid_columnconfigure(0, weight=1)
         
+        self.perf_job_controls = self.create_job_controls(results_frame)
+        
         self.results_text = tk.Text(results_frame, height=8)
         self.results_text.pack(fill=tk.X, pady=(0, 10))
         
@@ -315,29 +293,29 @@ class AlgorithmPlatform:
             messagebox.showinfo("info", "linked list is empty")
             return
         
-        # convert linked list to regular list for sorting
-        lst = self.linked_list.to_list()
         algorithm = self.ll_sort_algo.get()
-        
-        start_time = time.time()
-        
-        if algorithm == "Bubble Sort":
-            sorted_list = SortingAlgorithms.bubble_sort(lst.copy())
-        elif algorithm == "Insertion Sort":
-            sorted_list = SortingAlgorithms.insertion_sort(lst.copy())
-        elif algorithm == "Merge Sort":
-            sorted_list = SortingAlgorithms.merge_sort(lst.copy())
-        elif algorithm == "Quick Sort":
-            sorted_list = SortingAlgorithms.quick_sort(lst.copy())
-        elif algorithm == "Counting Sort":
-            sorted_list = SortingAlgorithms.counting_sort(lst.copy())
-        
-        time_taken = time.time() - start_time
-        
-        # rebuild linked list from sorted list
-        self.linked_list = LinkedList()
-        for num in reversed(sorted_list):  # insert at head reverses order
-            self.linked_list.insert_at_head(num)
+        if algorithm == IN_PLACE_LINKED_LIST_SORT:
+            # relink the existing nodes, nothing is copied
+            start_time = time.time()
+            self.linked_list.sort()
+            time_taken = time.time() - start_time
+        else:
+            # sort a copy of the values with an array-based algorithm, then write them back
+            # into the existing nodes in order
+            lst = self.linked_list.to_list()
+            stats = {}
+            start_time = time.time()
+            if algorithm == "Auto":
+                sorted_list = SortingAlgorithms.auto_sort(lst, stats)
+                algorithm = f"Auto -> {stats['algorithm']} ({stats['reason']})"
+            else:
+                sorted_list = SORT_ALGORITHMS[algorithm](lst)
+            time_taken = time.time() - start_time
+            
+            node = self.linked_list.head
+            for num in sorted_list:
+                node.data = num
+                node = node.next
         
         self.update_linked_list_display()
         messagebox.showinfo("sort complete", 
@@ -356,26 +334,82 @@ class AlgorithmPlatform:
         algorithm = self.sort_algo.get()
         original = numbers.copy()
         
+        stats = {}
         start_time = time.time()
-        
-        if algorithm == "Bubble Sort":
-            result = SortingAlgorithms.bubble_sort(numbers.copy())
-        elif algorithm == "Insertion Sort":
-            result = SortingAlgorithms.insertion_sort(numbers.copy())
-        elif algorithm == "Merge Sort":
-            result = SortingAlgorithms.merge_sort(numbers.copy())
-        elif algorithm == "Quick Sort":
-            result = SortingAlgorithms.quick_sort(numbers.copy())
-        elif algorithm == "Counting Sort":
-            result = SortingAlgorithms.counting_sort(numbers.copy())
-        
+        reverse = self.sort_reverse.get()
+        if algorithm in ("Natural Merge Sort", "Auto"):
+            result = SORT_ALGORITHMS[algorithm](numbers.copy(), stats, reverse=reverse)
+        else:
+            result = SORT_ALGORITHMS[algorithm](numbers.copy(), reverse=reverse)
         time_taken = time.time() - start_time
         
         self.output_text.delete(1.0, tk.END)
         self.output_text.insert(tk.END, f"algorithm: {algorithm}\n")
+        if "reason" in stats:
+            self.output_text.insert(tk.END, f"auto choice: {stats['algorithm']} ({stats['reason']})\n")
         self.output_text.insert(tk.END, f"original: {original}\n")
         self.output_text.insert(tk.END, f"sorted: {result}\n")
         self.output_text.insert(tk.END, f"time: {time_taken:.6f} seconds\n")
+        if "runs" in stats:
+            self.output_text.insert(tk.END, f"natural runs found: {stats['runs']} "
+                                            f"({stats['merged_runs']} after extending short ones to min_run)\n")
+        
+    def run_selection(self, operation):
+        # run a selection / top-k operation on the input numbers
+        try:
+            numbers = [int(num.strip()) for num in self.input_entry.get().split(",")]
+            k = int(self.k_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter valid numbers and k")
+            return
+        
+        original = numbers.copy()
+        start_time = time.time()
+        try:
+            result = SELECTION_ALGORITHMS[operation](numbers, k)
+        except IndexError as e:
+            messagebox.showerror("error", str(e))
+            return
+        time_taken = time.time() - start_time
+        if operation == "Partial Sort":
+            result = f"{result[:k]} | {result[k:]}"
+        
+        self.output_text.delete(1.0, tk.END)
+        self.output_text.insert(tk.END, f"operation: {operation} (k={k})\n")
+        self.output_text.insert(tk.END, f"original: {original}\n")
+        self.output_text.insert(tk.END, f"result: {result}\n")
+        self.output_text.insert(tk.END, f"time: {time_taken:.6f} seconds\n")
+    
+    def run_external_sort(self):
+        # sort an integer file into another file without loading it into memory
+        try:
+            memory_budget = int(float(self.memory_budget_entry.get()) * 1024 * 1024)
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid memory budget")
+            return
+        input_file = filedialog.askopenfilename(title="select file to sort", filetypes=[("text files", "*.txt")])
+        if not input_file:
+            return
+        output_file = filedialog.asksaveasfilename(title="save sorted file as", defaultextension=".txt",
+                                                   filetypes=[("text files", "*.txt")])
+        if not output_file:
+            return
+        algorithm = self.sort_algo.get()
+        start_time = time.time()
+        try:
+            count = SortingAlgorithms.external_sort(input_file, output_file, memory_budget,
+                                                    self.temp_dir_entry.get().strip() or None, algorithm)
+        except (OSError, ValueError, OverflowError) as e:
+            messagebox.showerror("error", f"external sort failed: {e}")
+            return
+        time_taken = time.time() - start_time
+        
+        self.output_text.delete(1.0, tk.END)
+        self.output_text.insert(tk.END, f"external sort with {algorithm} runs\n")
+        self.output_text.insert(tk.END, f"input: {input_file}\n")
+        self.output_text.insert(tk.END, f"output: {output_file}\n")
+        self.output_text.insert(tk.END, f"values sorted: {count}\n")
+        self.output_text.insert(tk.END, f"time: {time_taken:.6f} seconds\n")
         
     def create_linked_list_tab(self):
         # create linked list operations tab
@@ -403,6 +437,7 @@ class AlgorithmPlatform:
         self.ll_input_entry = ttk.Entry(manual_frame)
         self.ll_input_entry.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5)
         ttk.Button(manual_frame, text="insert at head", command=self.insert_to_linked_list).pack(side=tk.LEFT)
+        ttk.Button(manual_frame, text="append at tail", command=self.append_to_linked_list).pack(side=tk.LEFT, padx=5)
         
         # operations
         ops_frame = ttk.Frame(input_frame)
@@ -429,14 +464,46 @@ class AlgorithmPlatform:
         sort_frame = ttk.LabelFrame(input_frame, text="sort linked list", padding=5)
         sort_frame.pack(fill=tk.X, pady=5)
         
-        self.ll_sort_algo = tk.StringVar(value="Bubble Sort")
-        algorithms = ["Bubble Sort", "Insertion Sort", "Merge Sort", "Quick Sort", "Counting Sort"]
-        
-        for algo in algorithms:
+        self.ll_sort_algo = tk.StringVar(value=IN_PLACE_LINKED_LIST_SORT)
+        for algo in [IN_PLACE_LINKED_LIST_SORT] + list(SORT_ALGORITHMS):
             ttk.Radiobutton(sort_frame, text=algo, variable=self.ll_sort_algo, value=algo).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(sort_frame, text="sort list", command=self.sort_linked_list).pack(side=tk.LEFT, padx=5)
         
+        # skip list section: a sorted copy of the list answering queries in O(log n)
+        skip_frame = ttk.LabelFrame(input_frame, text="sorted skip list index", padding=5)
+        skip_frame.pack(fill=tk.X, pady=5)
+        
+        build_frame = ttk.Frame(skip_frame)
+        build_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(build_frame, text="seed:").pack(side=tk.LEFT)
+        self.skip_seed_entry = ttk.Entry(build_frame, width=10)
+        self.skip_seed_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Button(build_frame, text="build from linked list", command=self.build_skip_list).pack(side=tk.LEFT, padx=5)
+        self.skip_status = ttk.Label(build_frame, text="skip list: empty")
+        self.skip_status.pack(side=tk.LEFT, padx=5)
+        
+        query_frame = ttk.Frame(skip_frame)
+        query_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(query_frame, text="value:").pack(side=tk.LEFT)
+        self.skip_value_entry = ttk.Entry(query_frame, width=10)
+        self.skip_value_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Button(query_frame, text="insert", command=self.insert_to_skip_list).pack(side=tk.LEFT, padx=2)
+        ttk.Button(query_frame, text="delete", command=self.delete_from_skip_list).pack(side=tk.LEFT, padx=2)
+        for query in SKIP_LIST_QUERIES:
+            ttk.Button(query_frame, text=query,
+                       command=lambda q=query: self.query_skip_list(q)).pack(side=tk.LEFT, padx=2)
+        
+        range_frame = ttk.Frame(skip_frame)
+        range_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(range_frame, text="range from:").pack(side=tk.LEFT)
+        self.skip_low_entry = ttk.Entry(range_frame, width=10)
+        self.skip_low_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(range_frame, text="to:").pack(side=tk.LEFT)
+        self.skip_high_entry = ttk.Entry(range_frame, width=10)
+        self.skip_high_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Button(range_frame, text="values in range", command=self.skip_list_range).pack(side=tk.LEFT, padx=5)
+        
         # display section
         display_frame = ttk.LabelFrame(main_frame, text="linked list contents", padding=10)
         display_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -456,55 +523,250 @@ class AlgorithmPlatform:
         try:
             sizes = [int(size.strip()) for size in self.sizes_entry.get().split(",")]
             runs = int(self.runs_entry.get())
+            warmup = int(self.warmup_entry.get())
+            workers = [int(w.strip()) for w in self.workers_entry.get().split(",")]
+            k = int(self.perf_k_entry.get())
+            seed = self.sort_benchmark_seed()
+            budget = float(self.budget_entry.get()) if self.budget_entry.get().strip() else None
+            jobs = int(self.jobs_entry.get())
         except ValueError:
-            messagebox.showerror("error", "please enter valid sizes and runs")
+            messagebox.showerror("error", "please enter valid sizes, runs, warmup, budget, processes, workers, k and seed")
             return
         
         selected_algos = [algo for algo, var in self.algo_vars.items() if var.get()]
-        if not selected_algos:
+        selected_selections = [op for op, var in self.selection_vars.items() if var.get()]
+        if not selected_algos and not selected_selections:
             messagebox.showerror("error", "please select at least one algorithm")
             return
         
-        results = {algo: [] for algo in selected_algos}
+        distributions = [dist for dist, var in self.distribution_vars.items() if var.get()]
+        if not distributions:
+            messagebox.showerror("error", "please select at least one input distribution")
+            return
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "running performance tests...\n")
-        self.root.update()
+        self.start_benchmark("sort", dict(
+            sizes=sizes, runs=runs, algorithms=selected_algos, workers=workers, k=k,
+            selections=selected_selections, count_ops=self.count_ops.get(),
+            plot_counts=self.plot_counts.get(), warmup=warmup, distributions=distributions, seed=seed,
+            measure_memory=self.measure_memory.get(), budget=budget, jobs=jobs, isolate=self.isolate.get(),
+            pin_cpus=self.pin_cpus.get(), datasets=DatasetCache() if self.cache_datasets.get() else None,
+            buffers=self.sort_buffers.get()),
+            self.results_text, self.perf_job_controls)
+    
+    def sort_benchmark_seed(self):
+        # seed from the entry; with the input cache on an empty entry gets the fixed default
+        # seed, shown in the entry, since fresh random inputs would never be read from the cache
+        if not self.seed_entry.get().strip() and self.cache_datasets.get():
+            self.seed_entry.insert(0, str(DEFAULT_CACHE_SEED))
+        return int(self.seed_entry.get()) if self.seed_entry.get().strip() else None
+    
+    def run_batch_performance_test(self):
+        # compare sort_many with one sort call per list
+        try:
+            sizes = [int(size.strip()) for size in self.batch_lengths_entry.get().split(",")]
+            lists = int(self.batch_lists_entry.get())
+            runs = int(self.runs_entry.get())
+            warmup = int(self.warmup_entry.get())
+            seed = int(self.seed_entry.get()) if self.seed_entry.get().strip() else None
+        except ValueError:
+            messagebox.showerror("error", "please enter valid list lengths, lists, runs, warmup and seed")
+            return
         
-        for size in sizes:
-            self.results_text.insert(tk.END, f"\ntesting size {size}:\n")
-            
-            for algo in selected_algos:
-                times = []
-                for _ in range(runs):
-                    test_data = [random.randint(1, size*10) for _ in range(size)]
-                    sort_func = getattr(SortingAlgorithms, algo.lower().replace(" ", "_"))
-                    start = time.time()
-                    sort_func(test_data.copy())
-                    times.append(time.time() - start)
-                
-                avg_time = sum(times) / runs
-                results[algo].append(avg_time)
-                self.results_text.insert(tk.END, f"{algo}: {avg_time:.6f} sec\n")
-                self.root.update()
+        self.start_benchmark("batch", dict(sizes=sizes, runs=runs, lists=lists, warmup=warmup, seed=seed),
+                             self.results_text, self.perf_job_controls)
+    
+    def clear_dataset_cache(self):
+        # remove every cached benchmark input
+        cache = DatasetCache()
+        freed = cache.total_bytes()
+        cache.clear()
+        messagebox.showinfo("input cache", f"removed {freed / 2**20:.1f} MiB of cached inputs from {cache.directory}")
+    
+    def create_job_controls(self, parent):
+        # progress bar, status line and cancel button of a background benchmark
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.X, pady=(0, 5))
+        
+        controls = {"bar": ttk.Progressbar(frame, mode="determinate"),
+                    "status": ttk.Label(frame, text="idle", width=40),
+                    "cancel": ttk.Button(frame, text="cancel", command=self.cancel_benchmark, state=tk.DISABLED)}
+        controls["bar"].pack(side=tk.LEFT, fill=tk.X, expand=True)
+        controls["status"].pack(side=tk.LEFT, padx=5)
+        controls["cancel"].pack(side=tk.LEFT)
+        return controls
+    
+    def start_benchmark(self, suite, kwargs, text_widget, controls):
+        # run a benchmark suite in a background process; the GUI stays responsive and
+        # poll_benchmark picks up progress lines, finished cells and the final results
+        if self.job is not None:
+            messagebox.showerror("error", "a benchmark is already running")
+            return
         
+        # spawn, so the worker does not inherit the Tk state, and not a daemon, since
+        # Parallel Merge Sort starts worker processes of its own
+        context = multiprocessing.get_context("spawn")
+        messages = context.Queue()
+        cancel = context.Event()
+        process = context.Process(target=benchmarks.run_in_worker, args=(suite, kwargs, messages, cancel))
+        
+        text_widget.delete(1.0, tk.END)
+        controls["bar"].configure(value=0, maximum=1)
+        controls["status"].configure(text="starting...")
+        controls["cancel"].configure(state=tk.NORMAL)
+        process.start()
+        self.job = {"process": process, "messages": messages, "cancel": cancel, "text": text_widget,
+                    "controls": controls, "started": time.perf_counter()}
+        self.root.after(BENCHMARK_POLL_MS, self.poll_benchmark)
+    
+    def poll_benchmark(self):
+        # handle every message the running benchmark sent since the last poll
+        job = self.job
+        if job is None:
+            return
+        while True:
+            try:
+                message = job["messages"].get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            if kind == "line":
+                job["text"].insert(tk.END, message[1] + "\n")
+                job["text"].see(tk.END)
+            elif kind == "cell":
+                self.benchmark_cell_done(*message[1:])
+            elif kind == "done":
+                self.plot_benchmark(message[1])
+                self.store_benchmark(message[1])
+                self.finish_benchmark("done")
+                return
+            elif kind == "cancelled":
+                job["text"].insert(tk.END, "\ncancelled\n")
+                self.finish_benchmark("cancelled")
+                return
+            else:
+                self.finish_benchmark("failed")
+                messagebox.showerror("error", f"benchmark failed: {message[1]}")
+                return
+        if not job["process"].is_alive() and job["messages"].empty():
+            self.finish_benchmark("worker exited unexpectedly")
+            return
+        self.root.after(BENCHMARK_POLL_MS, self.poll_benchmark)
+    
+    def benchmark_cell_done(self, results, done, total):
+        # advance the progress bar, estimate the remaining time and replot after each finished size
+        job = self.job
+        sizes = results["sizes"]
+        cells_per_size = total // len(sizes)
+        # the runners go size by size, so weighting cells by input size keeps the
+        # estimate from being dominated by the fast small sizes
+        weights = [size for size in sizes for _ in range(cells_per_size)]
+        elapsed = time.perf_counter() - job["started"]
+        remaining = elapsed * sum(weights[done:]) / max(sum(weights[:done]), 1)
+        job["controls"]["bar"].configure(value=done, maximum=total)
+        job["controls"]["status"].configure(
+            text=f"cell {done}/{total}, {elapsed:.0f}s elapsed, eta {remaining:.0f}s")
+        if done % cells_per_size == 0:
+            self.plot_benchmark(results)
+    
+    def plot_benchmark(self, results, baseline=None, regressions=()):
+        # (re)draw a complete or partial result document on the performance chart
+        self.last_results = results
         self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        for algo in selected_algos:
-            ax.plot(sizes, results[algo], label=algo, marker='o')
-        
-        ax.set_xlabel('input size')
-        ax.set_ylabel('average time (seconds)')
-        ax.set_title('sorting algorithm performance')
-        ax.legend()
-        ax.grid(True)
+        benchmarks.plot_results(self.figure, results, baseline, regressions)
+        self.canvas.draw()
+    
+    def store_benchmark(self, results):
+        # append a finished run to the benchmark history
+        try:
+            run = history.save_run(results)
+        except OSError as e:
+            self.job["text"].insert(tk.END, f"\ncould not store the run: {e}\n")
+            return
+        self.job["text"].insert(tk.END, f"\nstored as run #{run['id']} in {history.DEFAULT_HISTORY_PATH}\n")
+        self.job["text"].see(tk.END)
+    
+    def refresh_baseline_runs(self):
+        # list the stored runs, newest first, when the baseline dropdown opens
+        try:
+            runs = history.load_runs()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("error", f"could not read the benchmark history: {e}")
+            return
+        self.baseline_combo["values"] = [history.describe(run) for run in reversed(runs)]
+    
+    def compare_with_baseline(self):
+        # overlay the chosen stored run on the plotted results and flag the regressed cells
+        if self.last_results is None:
+            messagebox.showerror("error", "run a benchmark first")
+            return
+        if not self.baseline_combo.get():
+            messagebox.showerror("error", "please choose a baseline run")
+            return
+        try:
+            threshold = float(self.threshold_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid threshold, e.g. 0.1 for 10%")
+            return
         
-        if max(sizes) / min(sizes) > 100:
-            ax.set_xscale('log')
-            ax.set_yscale('log')
+        # the dropdown entries start with "#<id> "
+        baseline = history.find_run(self.baseline_combo.get().split()[0][1:])
+        if baseline is None:
+            messagebox.showerror("error", "the baseline run is no longer in the history")
+            return
+        cells = history.compare(baseline["results"], self.last_results, threshold)
+        self.plot_benchmark(self.last_results, baseline["results"],
+                            [cell for cell in cells if cell["regressed"]])
         
-        self.canvas.draw()
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"compared with baseline {history.describe(baseline)}\n")
+        self.results_text.insert(tk.END, "\n".join(history.format_comparison(cells, threshold)) + "\n")
+    
+    def cancel_benchmark(self):
+        # ask the running benchmark to stop after the current cell, results of the finished
+        # sizes stay plotted; poll_benchmark finishes the job once the worker confirms
+        job = self.job
+        if job is None or job["cancel"].is_set():
+            return
+        job["cancel"].set()
+        job["controls"]["status"].configure(text="cancelling...")
+        job["controls"]["cancel"].configure(state=tk.DISABLED)
+        self.root.after(CANCEL_GRACE_MS, lambda: self.kill_benchmark(job))
+    
+    def kill_benchmark(self, job):
+        # hard stop of a benchmark that did not end on its cancel event: kill the process
+        # group of the worker, which takes its pool workers along
+        if self.job is not job:
+            return
+        process = job["process"]
+        killed = process.is_alive()
+        if killed:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, OSError):
+                # no process groups here, or the worker has not made its own yet; the pool
+                # workers still end with their parent, see benchmarks.cell_executors
+                process.terminate()
+        job["text"].insert(tk.END, "\ncancelled (killed)\n" if killed else "\ncancelled\n")
+        self.finish_benchmark("cancelled")
+    
+    def finish_benchmark(self, status):
+        # release the worker and reset the controls of the finished benchmark
+        job, self.job = self.job, None
+        job["process"].join()
+        job["messages"].close()
+        job["controls"]["status"].configure(
+            text=f"{status} after {time.perf_counter() - job['started']:.0f}s")
+        job["controls"]["cancel"].configure(state=tk.DISABLED)
+    
+    def on_close(self):
+        # stop a running benchmark before the window goes away, killing it if it does not
+        # end on its cancel event within the grace period
+        job = self.job
+        if job is not None:
+            job["cancel"].set()
+            job["process"].join(CANCEL_GRACE_MS / 1000)
+            self.kill_benchmark(job)
+        self.root.destroy()
     
     def load_linked_list_from_file(self):
         # load linked list data from file
@@ -523,6 +785,17 @@ class AlgorithmPlatform:
         self.linked_list.insert_at_head(value)
         self.ll_input_entry.delete(0, tk.END)
         self.update_linked_list_display()
+    
+    def append_to_linked_list(self):
+        # append value at the tail of linked list
+        try:
+            value = int(self.ll_input_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid integer")
+            return
+        self.linked_list.append(value)
+        self.ll_input_entry.delete(0, tk.END)
+        self.update_linked_list_display()
 
     def search_linked_list(self):
         # search for value in linked list
@@ -583,6 +856,76 @@ class AlgorithmPlatform:
         if ll_contents:
             self.ll_display.insert(tk.END, "List contents:\n")
             self.ll_display.insert(tk.END, ",".join(map(str, ll_contents)))
+    
+    def build_skip_list(self):
+        # index the current linked list values in a new skip list
+        try:
+            seed = int(self.skip_seed_entry.get()) if self.skip_seed_entry.get().strip() else None
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid integer seed")
+            return
+        self.skip_list = SkipList(seed)
+        start_time = time.time()
+        self.skip_list.extend(self.linked_list.to_list())
+        time_taken = time.time() - start_time
+        self.update_skip_list_status()
+        messagebox.showinfo("skip list", f"indexed {self.skip_list.size} values in {time_taken:.6f} seconds")
+    
+    def insert_to_skip_list(self):
+        # insert value into the skip list
+        try:
+            value = int(self.skip_value_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid integer")
+            return
+        self.skip_list.insert(value)
+        self.update_skip_list_status()
+    
+    def delete_from_skip_list(self):
+        # delete one occurrence of value from the skip list
+        try:
+            value = int(self.skip_value_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid integer")
+            return
+        if self.skip_list.delete(value):
+            self.update_skip_list_status()
+            messagebox.showinfo("success", f"value {value} deleted from skip list")
+        else:
+            messagebox.showinfo("not found", f"value {value} not found in skip list")
+    
+    def query_skip_list(self, query):
+        # run one of SKIP_LIST_QUERIES for the entered value
+        try:
+            value = int(self.skip_value_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter a valid integer")
+            return
+        result = getattr(self.skip_list, query)(value)
+        if query == "search":
+            found = "found" if result else "not found"
+            messagebox.showinfo("search result", f"value {value} {found} in skip list")
+        elif result is not None:
+            messagebox.showinfo(query, f"{query} of {value}: {result}")
+        else:
+            messagebox.showinfo(query, f"no {query} found for {value}")
+    
+    def skip_list_range(self):
+        # list the skip list values between the two bounds
+        try:
+            low = int(self.skip_low_entry.get())
+            high = int(self.skip_high_entry.get())
+        except ValueError:
+            messagebox.showerror("error", "please enter valid integer bounds")
+            return
+        values = list(self.skip_list.iter_range(low, high))
+        shown = ", ".join(map(str, values[:SKIP_LIST_RANGE_SHOWN]))
+        more = f", ... ({len(values) - SKIP_LIST_RANGE_SHOWN} more)" if len(values) > SKIP_LIST_RANGE_SHOWN else ""
+        messagebox.showinfo("range", f"{len(values)} values from {low} to {high}:\n{shown}{more}")
+    
+    def update_skip_list_status(self):
+        # show the skip list size and number of levels
+        self.skip_status.configure(text=f"skip list: {self.skip_list.size} values, {self.skip_list.levels()} levels")
             
     def create_bst_tab(self):
         # create binary search tree operations tab
@@ -853,6 +1196,10 @@ class AlgorithmPlatform:
         
         ttk.Button(perf_frame, text="run performance test", command=self.run_hash_performance_test).pack(pady=5)
         ttk.Button(perf_frame, text="Run Structure Comparison", command=self.run_structure_performance_test).pack(pady=5)
+        self.structure_memory = tk.BooleanVar(value=False)
+        ttk.Checkbutton(perf_frame, text="also measure memory and per-element footprint",
+                        variable=self.structure_memory).pack(anchor=tk.W)
+        self.hash_job_controls = self.create_job_controls(perf_frame)
         # display frame
         display_frame = ttk.LabelFrame(main_frame, text="hash table contents", padding=10)
         display_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -956,88 +1303,7 @@ class AlgorithmPlatform:
             messagebox.showerror("error", "please enter valid sizes and runs")
             return
         
-        # Test both successful and unsuccessful searches
-        test_types = ["successful", "unsuccessful"]
-        hash_types = ["Chaining", "Linear Probing", "Double Hashing"]
-        
-        results = {ht: {test: [] for test in test_types} for ht in hash_types}
-        
-        self.hash_display.delete(1.0, tk.END)
-        self.hash_display.insert(tk.END, "running performance tests...\n")
-        self.root.update()
-        
-        for size in sizes:
-            self.hash_display.insert(tk.END, f"\ntesting size {size}:\n")
-            
-            # Generate test data
-            test_data = [str(random.randint(1, size*10)) for _ in range(size)]
-            search_data = test_data.copy()
-            not_present_data = [str(random.randint(size*10 + 1, size*20)) for _ in range(size)]
-            
-            for ht_type in hash_types:
-                # Create hash table
-                if ht_type == "Chaining":
-                    ht = ChainingHashTable(size*2)  # Larger size to keep load factor reasonable
-                elif ht_type == "Linear Probing":
-                    ht = LinearProbingHashTable(size*2)
-                elif ht_type == "Double Hashing":
-                    ht = DoubleHashingHashTable(size*2)
-                
-                # Insert all test data
-                for key in test_data:
-                    ht.insert(key, f"value_{key}")
-                
-                # Test successful searches
-                start_time = time.time()
-                for _ in range(runs):
-                    for key in search_data[:100]:  # Limit to 100 searches per run
-                        ht.search(key)
-                successful_time = (time.time() - start_time) / runs
-                results[ht_type]["successful"].append(successful_time)
-                
-                # Test unsuccessful searches
-                start_time = time.time()
-                for _ in range(runs):
-                    for key in not_present_data[:100]:  # Limit to 100 searches per run
-                        ht.search(key)
-                unsuccessful_time = (time.time() - start_time) / runs
-                results[ht_type]["unsuccessful"].append(unsuccessful_time)
-                
-                self.hash_display.insert(tk.END, 
-                    f"{ht_type}: successful={successful_time:.6f}s, unsuccessful={unsuccessful_time:.6f}s\n")
-                self.root.update()
-        
-        # Plot results
-        self.figure.clear()
-        
-        # Successful searches plot
-        ax1 = self.figure.add_subplot(121)
-        for ht_type in hash_types:
-            ax1.plot(sizes, results[ht_type]["successful"], label=ht_type, marker='o')
-        ax1.set_xlabel('input size')
-        ax1.set_ylabel('average time (seconds)')
-        ax1.set_title('Successful Searches')
-        ax1.legend()
-        ax1.grid(True)
-        if max(sizes) / min(sizes) > 100:
-            ax1.set_xscale('log')
-            ax1.set_yscale('log')
-        
-        # Unsuccessful searches plot
-        ax2 = self.figure.add_subplot(122)
-        for ht_type in hash_types:
-            ax2.plot(sizes, results[ht_type]["unsuccessful"], label=ht_type, marker='o')
-        ax2.set_xlabel('input size')
-        ax2.set_ylabel('average time (seconds)')
-        ax2.set_title('Unsuccessful Searches')
-        ax2.legend()
-        ax2.grid(True)
-        if max(sizes) / min(sizes) > 100:
-            ax2.set_xscale('log')
-            ax2.set_yscale('log')
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self.start_benchmark("hash", dict(sizes=sizes, runs=runs), self.hash_display, self.hash_job_controls)
         
     def run_structure_performance_test(self):
     # Run performance comparison of data structures
@@ -1048,539 +1314,8 @@ class AlgorithmPlatform:
             messagebox.showerror("Error", "Please enter valid sizes and runs")
             return
         
-        structures = ["Array", "Linked List", "BST"]
-        operations = ["Insertion", "Deletion", "Search"]
-        
-        # Initialize results dictionary
-        results = {struct: {op: [] for op in operations} for struct in structures}
-        
-        self.hash_display.delete(1.0, tk.END)
-        self.hash_display.insert(tk.END, "Running performance tests...\n")
-        self.root.update()
-        
-        for size in sizes:
-            self.hash_display.insert(tk.END, f"\nTesting size {size}:\n")
-            
-            # Test Array
-            arr_times = {op: [] for op in operations}
-            for _ in range(runs):
-                test_data = [random.randint(1, size*10) for _ in range(size)]
-                
-                # Insertion (append)
-                start = time.time()
-                test_data.append(random.randint(1, size*10))
-                arr_times["Insertion"].append(time.time() - start)
-                
-                # Deletion (remove last)
-                start = time.time()
-                if test_data:
-                    test_data.pop()
-                arr_times["Deletion"].append(time.time() - start)
-                
-                # Search
-                target = random.choice(test_data) if test_data else 0
-                start = time.time()
-                target in test_data
-                arr_times["Search"].append(time.time() - start)
-            
-            # Test Linked List
-            ll_times = {op: [] for op in operations}
-            for _ in range(runs):
-                ll = LinkedList()
-                for num in [random.randint(1, size*10) for _ in range(size)]:
-                    ll.insert_at_head(num)
-                
-                # Insertion
-                start = time.time()
-                ll.insert_at_head(random.randint(1, size*10))
-                ll_times["Insertion"].append(time.time() - start)
-                
-                # Deletion (remove head)
-                start = time.time()
-                if ll.head:
-                    ll.head = ll.head.next
-                    ll.size -= 1
-                ll_times["Deletion"].append(time.time() - start)
-                
-                # Search
-                lst = ll.to_list()
-                target = random.choice(lst) if lst else 0
-                start = time.time()
-                ll.search(target)
-                ll_times["Search"].append(time.time() - start)
-            
-            # Test BST
-            bst_times = {op: [] for op in operations}
-            for _ in range(runs):
-                bst = BinarySearchTree()
-                for num in [random.randint(1, size*10) for _ in range(size)]:
-                    bst.insert(num)
-                
-                # Insertion
-                start = time.time()
-                bst.insert(random.randint(1, size*10))
-                bst_times["Insertion"].append(time.time() - start)
-                
-                # Deletion
-                lst = bst.inorder_traversal()
-                target = random.choice(lst) if lst else 0
-                start = time.time()
-                bst.delete(target)
-                bst_times["Deletion"].append(time.time() - start)
-                
-                # Search
-                start = time.time()
-                bst.search(target)
-                bst_times["Search"].append(time.time() - start)
-            
-            # Calculate averages and store results
-            for struct, times in zip(structures, [arr_times, ll_times, bst_times]):
-                for op in operations:
-                    avg_time = sum(times[op]) / runs * 1000  # Convert to milliseconds
-                    results[struct][op].append(avg_time)
-                    self.hash_display.insert(tk.END, 
-                        f"{struct} {op}: {avg_time:.2f} ms\n")
-                    self.root.update()
-        
-        # Plot results
-        self.figure.clear()
-        
-        # Create one plot per operation
-        for i, op in enumerate(operations):
-            ax = self.figure.add_subplot(1, 3, i+1)
-            for struct in structures:
-                ax.plot(sizes, results[struct][op], label=struct, marker='o')
-            ax.set_xlabel('Input Size')
-            ax.set_ylabel('Time (ms)')
-            ax.set_title(f'{op} Performance')
-            ax.legend()
-            ax.grid(True)
-            if max(sizes) / min(sizes) > 100:
-                ax.set_xscale('log')
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
-
-class BinarySearchTree:
-    # class implementing binary search tree functionality
-    
-    class Node:
-        # nested class for BST nodes
-        def __init__(self, data):
-            self.data = data
-            self.left = None
-            self.right = None
-    
-    def __init__(self):
-        # initialize empty BST
-        self.root = None
-        self.size = 0
-    
-    def insert(self, data):
-        # insert data into BST
-        self.root = self._insert_recursive(self.root, data)
-        self.size += 1
-    
-    def _insert_recursive(self, node, data):
-        # recursive helper for insertion
-        if node is None:
-            return self.Node(data)
-        
-        if data < node.data:
-            node.left = self._insert_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._insert_recursive(node.right, data)
-        # if data equals node.data, don't insert duplicate
-        
-        return node
-    
-    def delete(self, data):
-        # delete data from BST
-        self.root = self._delete_recursive(self.root, data)
-    
-    def _delete_recursive(self, node, data):
-        # recursive helper for deletion
-        if node is None:
-            return node
-        
-        if data < node.data:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._delete_recursive(node.right, data)
-        else:
-            # node to be deleted found
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
-            # node with two children - get inorder successor
-            min_node = self._find_min_node(node.right)
-            node.data = min_node.data
-            node.right = self._delete_recursive(node.right, min_node.data)
-            
-        return node
-    
-    def search(self, data):
-        # search for data in BST
-        return self._search_recursive(self.root, data)
-    
-    def _search_recursive(self, node, data):
-        # recursive helper for search
-        if node is None or node.data == data:
-            return node
-        
-        if data < node.data:
-            return self._search_recursive(node.left, data)
-        else:
-            return self._search_recursive(node.right, data)
-    
-    def minimum(self):
-        # find minimum value in BST
-        if self.root is None:
-            return None
-        return self._find_min_node(self.root).data
-    
-    def _find_min_node(self, node):
-        # find node with minimum value
-        while node.left is not None:
-            node = node.left
-        return node
-    
-    def maximum(self):
-        # find maximum value in BST
-        if self.root is None:
-            return None
-        node = self.root
-        while node.right is not None:
-            node = node.right
-        return node.data
-    
-    def predecessor(self, data):
-        # find predecessor of given value
-        return self._predecessor_recursive(self.root, data, None)
-    
-    def _predecessor_recursive(self, node, data, predecessor):
-        # recursive helper for predecessor
-        if node is None:
-            return predecessor
-        
-        if data <= node.data:
-            return self._predecessor_recursive(node.left, data, predecessor)
-        else:
-            return self._predecessor_recursive(node.right, data, node.data)
-    
-    def successor(self, data):
-        # find successor of given value
-        return self._successor_recursive(self.root, data, None)
-    
-    def _successor_recursive(self, node, data, successor):
-        # recursive helper for successor
-        if node is None:
-            return successor
-        
-        if data >= node.data:
-            return self._successor_recursive(node.right, data, successor)
-        else:
-            return self._successor_recursive(node.left, data, node.data)
-    
-    def inorder_traversal(self):
-        # return inorder traversal of BST (sorted order)
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-    
-    def _inorder_recursive(self, node, result):
-        # recursive helper for inorder traversal
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.data)
-            self._inorder_recursive(node.right, result)
-    
-    def preorder_traversal(self):
-        # return preorder traversal of BST
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
-    
-    def _preorder_recursive(self, node, result):
-        # recursive helper for preorder traversal
-        if node is not None:
-            result.append(node.data)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
-    
-    def postorder_traversal(self):
-        # return postorder traversal of BST
-        result = []
-        self._postorder_recursive(self.root, result)
-        return result
-    
-    def _postorder_recursive(self, node, result):
-        # recursive helper for postorder traversal
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.data)
-    
-    def load_from_file(self, filename):
-        # load BST data from file (one number per line)
-        try:
-            with open(filename, 'r') as file:
-                for line in file:
-                    self.insert(int(line.strip()))
-            return True
-        except Exception as e:
-            print(f"error loading file: {e}")
-            return False
-    
-    def visualize_tree(self):
-        # create a visual representation of the tree
-        if self.root is None:
-            return "Tree is empty"
-        
-        lines = []
-        self._visualize_recursive(self.root, lines, 0, "Root: ")
-        return "\n".join(lines)
-    
-    def _visualize_recursive(self, node, lines, depth, prefix):
-        # recursive helper for tree visualization
-        if node is not None:
-            lines.append("  " * depth + prefix + str(node.data))
-            if node.left is not None or node.right is not None:
-                if node.left is not None:
-                    self._visualize_recursive(node.left, lines, depth + 1, "L--- ")
-                else:
-                    lines.append("  " * (depth + 1) + "L--- None")
-                
-                if node.right is not None:
-                    self._visualize_recursive(node.right, lines, depth + 1, "R--- ")
-                else:
-                    lines.append("  " * (depth + 1) + "R--- None")
-
-class HashTable:
-    # Base class for hash table implementations
-    class Node:
-        def __init__(self, key, value):
-            self.key = key
-            self.value = value
-            self.next = None
-    
-    def __init__(self, size=101):
-        self.size = size
-        self.count = 0
-    
-    def hash_function1(self, key):
-        return hash(key) % self.size
-    
-    def hash_function2(self, key):
-        return 1 + (hash(key) % (self.size - 1))
-    
-    def insert(self, key, value):
-        raise NotImplementedError
-    
-    def search(self, key):
-        raise NotImplementedError
-    
-    def delete(self, key):
-        raise NotImplementedError
-    
-    def load_factor(self):
-        return self.count / self.size
-    
-    def resize(self, new_size):
-        raise NotImplementedError
-
-
-class ChainingHashTable(HashTable):
-    # Hash table with chaining collision resolution
-    def __init__(self, size=101):
-        super().__init__(size)
-        self.table = [None] * self.size
-    
-    def insert(self, key, value):
-        index = self.hash_function1(key)
-        if self.table[index] is None:
-            self.table[index] = self.Node(key, value)
-        else:
-            current = self.table[index]
-            while current.next is not None:
-                if current.key == key:
-                    current.value = value  # Update existing key
-                    return
-                current = current.next
-            if current.key == key:
-                current.value = value  # Update existing key
-            else:
-                current.next = self.Node(key, value)
-        self.count += 1
-    
-    def search(self, key):
-        index = self.hash_function1(key)
-        current = self.table[index]
-        while current is not None:
-            if current.key == key:
-                return current.value
-            current = current.next
-        return None
-    
-    def delete(self, key):
-        index = self.hash_function1(key)
-        current = self.table[index]
-        prev = None
-        while current is not None:
-            if current.key == key:
-                if prev is None:
-                    self.table[index] = current.next
-                else:
-                    prev.next = current.next
-                self.count -= 1
-                return True
-            prev = current
-            current = current.next
-        return False
-
-
-class LinearProbingHashTable(HashTable):
-    # Hash table with linear probing collision resolution
-    def __init__(self, size=101):
-        super().__init__(size)
-        self.table = [None] * self.size
-    
-    def insert(self, key, value):
-        if self.load_factor() > 0.7:
-            self.resize(self.size * 2)
-        
-        index = self.hash_function1(key)
-        while self.table[index] is not None and self.table[index].key != key:
-            index = (index + 1) % self.size
-        
-        if self.table[index] is None:
-            self.count += 1
-        self.table[index] = self.Node(key, value)
-    
-    def search(self, key):
-        index = self.hash_function1(key)
-        original_index = index
-        while self.table[index] is not None:
-            if self.table[index].key == key:
-                return self.table[index].value
-            index = (index + 1) % self.size
-            if index == original_index:
-                break
-        return None
-    
-    def delete(self, key):
-        index = self.hash_function1(key)
-        original_index = index
-        while self.table[index] is not None:
-            if self.table[index].key == key:
-                self.table[index] = None
-                self.count -= 1
-                self._rehash()
-                return True
-            index = (index + 1) % self.size
-            if index == original_index:
-                break
-        return False
-    
-    def _rehash(self):
-        old_table = self.table
-        self.table = [None] * self.size
-        self.count = 0
-        for node in old_table:
-            if node is not None:
-                self.insert(node.key, node.value)
-    
-    def resize(self, new_size):
-        old_table = self.table
-        self.size = new_size
-        self.table = [None] * self.size
-        self.count = 0
-        for node in old_table:
-            if node is not None:
-                self.insert(node.key, node.value)
-
-
-class DoubleHashingHashTable(HashTable):
-    # Hash table with double hashing collision resolution
-    def __init__(self, size=101):
-        super().__init__(size)
-        self.table = [None] * self.size
-    
-    def insert(self, key, value):
-        if self.load_factor() > 0.7:
-            self.resize(self.size * 2)
-        
-        index = self.hash_function1(key)
-        step = self.hash_function2(key)
-        attempts = 0
-        
-        while (self.table[index] is not None and 
-               self.table[index].key != key and 
-               attempts < self.size):
-            index = (index + step) % self.size
-            attempts += 1
-        
-        if attempts == self.size:
-            raise Exception("Hash table is full")
-        
-        if self.table[index] is None:
-            self.count += 1
-        self.table[index] = self.Node(key, value)
-    
-    def search(self, key):
-        index = self.hash_function1(key)
-        step = self.hash_function2(key)
-        original_index = index
-        attempts = 0
-        
-        while (self.table[index] is not None and 
-               attempts < self.size):
-            if self.table[index].key == key:
-                return self.table[index].value
-            index = (index + step) % self.size
-            attempts += 1
-            if index == original_index:
-                break
-        return None
-    
-    def delete(self, key):
-        index = self.hash_function1(key)
-        step = self.hash_function2(key)
-        original_index = index
-        attempts = 0
-        
-        while (self.table[index] is not None and 
-               attempts < self.size):
-            if self.table[index].key == key:
-                self.table[index] = None
-                self.count -= 1
-                self._rehash()
-                return True
-            index = (index + step) % self.size
-            attempts += 1
-            if index == original_index:
-                break
-        return False
-    
-    def _rehash(self):
-        old_table = self.table
-        self.table = [None] * self.size
-        self.count = 0
-        for node in old_table:
-            if node is not None:
-                self.insert(node.key, node.value)
-    
-    def resize(self, new_size):
-        old_table = self.table
-        self.size = new_size
-        self.table = [None] * self.size
-        self.count = 0
-        for node in old_table:
-            if node is not None:
-                self.insert(node.key, node.value)   
-        
+        self.start_benchmark("structures", dict(sizes=sizes, runs=runs, measure_memory=self.structure_memory.get()),
+                             self.hash_display, self.hash_job_controls)
 
 # main entry point
 if __name__ == "__main__":
@@ -0,0 +1,2130 @@
+# sorting algorithms and data structures behind the algorithm platform, no GUI dependencies
+import os
+import sys
+import bisect
+import functools
+import heapq
+import itertools
+import random
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from array import array, typecodes as ARRAY_TYPECODES
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np  # optional, used to vectorize radix sort passes
+except ImportError:
+    np = None
+
+# seconds between the checks of exit_with_parent
+PARENT_POLL_SECONDS = 0.5
+
+def exit_with_parent(stop=None):
+    # process pool initializer: a daemon thread ends the worker once the process that started
+    # it is gone, or once stop (a multiprocessing.RawValue) is set, so a killed or cancelled
+    # benchmark leaves no orphaned workers sorting on; stop is read without a lock, as a worker
+    # that exits while holding a shared lock would leave it locked for every other process
+    parent = os.getppid()
+
+    def watch():
+        while os.getppid() == parent and not (stop is not None and stop.value):
+            time.sleep(PARENT_POLL_SECONDS)
+        os._exit(1)
+    threading.Thread(target=watch, daemon=True).start()
+
+def keyed(engine):
+    # give a comparison sorting engine key= and reverse= by decorate-sort-undecorate:
+    # every key is computed once and ties are broken by position, so the result is stable
+    @functools.wraps(engine)
+    def wrapper(arr, *args, key=None, reverse=False, **kwargs):
+        if key is None and not reverse:
+            return engine(arr, *args, **kwargs)
+        sign = -1 if reverse else 1
+        keys = arr if key is None else [key(x) for x in arr]
+        decorated = engine([(k, sign * i) for i, k in enumerate(keys)], *args, **kwargs)
+        if reverse:
+            decorated.reverse()
+        arr[:] = [arr[sign * i] for _, i in decorated]
+        return arr
+    return wrapper
+
+def integer_keyed(engine):
+    # key= and reverse= for radix sort: key must return an int, each key and its position are
+    # packed into one int so ties stay in input order
+    @functools.wraps(engine)
+    def wrapper(arr, *args, key=None, reverse=False, **kwargs):
+        if key is None and not reverse:
+            return engine(arr, *args, **kwargs)
+        n = len(arr)
+        if n < 2:
+            return arr
+        keys = arr if key is None else [key(x) for x in arr]
+        if reverse:
+            base = max(keys)
+            packed = [(base - k) * n + i for i, k in enumerate(keys)]
+        else:
+            base = min(keys)
+            packed = [(k - base) * n + i for i, k in enumerate(keys)]
+        packed = engine(packed, *args, **kwargs)
+        arr[:] = [arr[code % n] for code in packed]
+        return arr
+    return wrapper
+
+def counting_keyed(engine):
+    # key= and reverse= for counting sort: key must return an int; a stable counting sort of
+    # the records themselves (keys extracted once, counted, prefix summed, records scattered),
+    # key ranges too sparse for a count array go to keyed radix sort like the plain engine does
+    @functools.wraps(engine)
+    def wrapper(arr, *args, key=None, reverse=False, **kwargs):
+        if key is None and not reverse:
+            return engine(arr, *args, **kwargs)
+        n = len(arr)
+        if n < 2:
+            return arr
+        keys = arr if key is None else [key(x) for x in arr]
+        min_key, max_key = min(keys), max(keys)
+        key_range = max_key - min_key + 1
+        if key_range > max(SortingAlgorithms.COUNTING_SORT_MAX_RANGE_RATIO * n,
+                           SortingAlgorithms.COUNTING_SORT_MIN_RANGE):
+            return SortingAlgorithms.radix_sort(arr, key=key, reverse=reverse)
+        slots = [max_key - k for k in keys] if reverse else [k - min_key for k in keys]
+        count = [0] * key_range
+        for slot in slots:
+            count[slot] += 1
+        # prefix sums turn every count into the first output position of its slot
+        position = 0
+        for slot, slot_count in enumerate(count):
+            count[slot] = position
+            position += slot_count
+        output = [None] * n
+        for record, slot in zip(arr, slots):
+            output[count[slot]] = record
+            count[slot] += 1
+        arr[:] = output
+        return arr
+    return wrapper
+
+class SortingAlgorithms:
+    #class containing all sorting algorithm implementations
+    
+    # counting sort hands over to radix sort once the count array would be
+    # this many times larger than the input (and larger than the floor below)
+    COUNTING_SORT_MAX_RANGE_RATIO = 8
+    COUNTING_SORT_MIN_RANGE = 1 << 16
+    # below this many elements the numpy radix path costs more than it saves
+    RADIX_NUMPY_THRESHOLD = 1 << 10
+    # partitions this small are finished off with insertion sort
+    INSERTION_SORT_CUTOFF = 16
+    # consecutive wins by one side before natural merge sort starts galloping
+    MIN_GALLOP = 7
+    # auto dispatch: at most one natural run per this many elements counts as presorted
+    AUTO_PRESORTED_RUN_LENGTH = 32
+    # auto dispatch: elements sampled to estimate the duplicate ratio
+    AUTO_SAMPLE_SIZE = 1000
+    # auto dispatch: most one-byte passes of pure python radix sort that still beat introsort
+    # (6 passes, 48-bit spans: 0.77 vs 0.93 ms at 1000 elements; 13 passes: 2.5 vs 1.4 ms)
+    AUTO_RADIX_MAX_PASSES = 6
+    # below this many elements a process pool costs more than it saves
+    PARALLEL_MIN_SIZE = 1 << 14
+    # external sort: bytes per value held in memory (boxed int, list slots, engine scratch, run
+    # buffer); tracemalloc peaks at up to 98 per chunk value across the engines, the rest is headroom
+    EXTERNAL_SORT_ITEM_BYTES = 112
+    EXTERNAL_SORT_DEFAULT_BUDGET = 64 * 1024 * 1024
+    # typed buffers: sort_buffer engine name for numpy's own sort, only used when asked for
+    NUMPY_SORT = "NumPy Sort"
+    # typed buffers: engines that only index and assign, so they run on any mutable buffer;
+    # the others need slices to be copies, which only holds for array.array
+    BUFFER_INDEX_ENGINES = ("Bubble Sort", "Insertion Sort", "Quick Sort")
+    # batch sorting: lists up to this long go through a sorting network (in pure python these
+    # beat both quick sort and insertion sort up to 64 elements), longer ones are quick sorted
+    SORT_MANY_MAX_LENGTH = 64
+    # batch sorting: numpy takes over for lists longer than this, from this many lists per call
+    SORT_MANY_NUMPY_MIN_LENGTH = 16
+    SORT_MANY_NUMPY_MIN_BATCH = 256
+    
+    @staticmethod
+    @keyed
+    def bubble_sort(arr):
+        # bubble sort implementation with adjacent element comparison and swapping
+        n = len(arr)
+        for i in range(n):
+            for j in range(n-i-1):
+                if arr[j] > arr[j+1]:
+                    arr[j], arr[j+1] = arr[j+1], arr[j]
+        return arr
+
+    @staticmethod
+    @keyed
+    def insertion_sort(arr):
+        # insertion sort that builds sorted array one element at a time
+        for i in range(1, len(arr)):
+            key = arr[i]
+            j = i-1
+            while j >= 0 and arr[j] > key:
+                arr[j+1] = arr[j]
+                j -= 1
+            arr[j+1] = key
+        return arr
+
+    @staticmethod
+    @keyed
+    def merge_sort(arr):
+        # merge sort using divide and conquer approach
+        return SortingAlgorithms._merge_sort(arr)
+
+    @staticmethod
+    def _merge_sort(arr):
+        # recursive body of merge_sort, outside the key= wrapper so recursion does not re-enter it
+        if len(arr) > 1:
+            mid = len(arr)//2
+            left = arr[:mid]
+            right = arr[mid:]
+            SortingAlgorithms._merge_sort(left)
+            SortingAlgorithms._merge_sort(right)
+            i = j = k = 0
+            while i < len(left) and j < len(right):
+                if left[i] <= right[j]:
+                    arr[k] = left[i]
+                    i += 1
+                else:
+                    arr[k] = right[j]
+                    j += 1
+                k += 1
+            while i < len(left):
+                arr[k] = left[i]
+                i += 1
+                k += 1
+            while j < len(right):
+                arr[k] = right[j]
+                j += 1
+                k += 1
+        return arr
+
+    @staticmethod
+    @keyed
+    def bottom_up_merge_sort(arr):
+        # iterative merge sort, ping-pongs between arr and a single scratch buffer; runs of
+        # INSERTION_SORT_CUTOFF are insertion sorted first and every copy is an index loop, so
+        # no temporary lists are made besides the scratch buffer
+        n = len(arr)
+        if n < 2:
+            return arr
+        width = SortingAlgorithms.INSERTION_SORT_CUTOFF
+        for lo in range(0, n, width):
+            SortingAlgorithms._insertion_sort_range(arr, lo, min(lo + width, n) - 1)
+        if width >= n:
+            return arr
+        src, dst = arr, arr[:]
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                if mid >= hi or src[mid - 1] <= src[mid]:
+                    # runs already in order, nothing to merge
+                    for k in range(lo, hi):
+                        dst[k] = src[k]
+                    continue
+                i, j, k = lo, mid, lo
+                while i < mid and j < hi:
+                    # take from the left run on ties to keep the sort stable
+                    if src[j] < src[i]:
+                        dst[k] = src[j]
+                        j += 1
+                    else:
+                        dst[k] = src[i]
+                        i += 1
+                    k += 1
+                # one run is used up, copy what is left of the other
+                while i < mid:
+                    dst[k] = src[i]
+                    i += 1
+                    k += 1
+                while j < hi:
+                    dst[k] = src[j]
+                    j += 1
+                    k += 1
+            src, dst = dst, src
+            width *= 2
+        if src is not arr:
+            arr[:] = src
+        return arr
+
+    @staticmethod
+    @keyed
+    def natural_merge_sort(arr, stats=None):
+        # timsort-style merge sort that reuses the ascending/descending runs already in arr
+        # pass a dict as stats to get back the number of natural runs in the input ("runs", as
+        # count_runs reports it) and of runs merged once short ones were extended to min_run
+        n = len(arr)
+        if stats is not None:
+            stats["runs"] = SortingAlgorithms.count_runs(arr)
+        run_count = 0
+        if n >= 2:
+            min_run = SortingAlgorithms._min_run_length(n)
+            runs = []  # stack of [start, length]
+            lo = 0
+            while lo < n:
+                run_len = SortingAlgorithms._count_run_and_make_ascending(arr, lo, n)
+                run_count += 1
+                if run_len < min_run:
+                    # short run, extend it to min_run with binary insertion sort
+                    forced = min(min_run, n - lo)
+                    SortingAlgorithms._binary_insertion_sort(arr, lo, lo + forced, lo + run_len)
+                    run_len = forced
+                runs.append([lo, run_len])
+                SortingAlgorithms._merge_collapse(arr, runs)
+                lo += run_len
+            while len(runs) > 1:
+                i = len(runs) - 2
+                if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+                SortingAlgorithms._merge_at(arr, runs, i)
+        elif n == 1:
+            run_count = 1
+        if stats is not None:
+            stats["merged_runs"] = run_count
+        return arr
+
+    @staticmethod
+    @keyed
+    def auto_sort(arr, stats=None):
+        # profile the input and hand it to the engine that suits it best
+        # pass a dict as stats to get back the chosen algorithm and the reason
+        algorithm, reason = SortingAlgorithms.choose_algorithm(arr)
+        if stats is not None:
+            stats["algorithm"] = algorithm
+            stats["reason"] = reason
+        if algorithm == "Natural Merge Sort":
+            return SortingAlgorithms.natural_merge_sort(arr, stats)
+        return SORT_ALGORITHMS[algorithm](arr)
+
+    @staticmethod
+    @keyed
+    def parallel_merge_sort(arr, workers=None, engine="Quick Sort"):
+        # sort chunks with the given engine in a process pool, then k-way merge them with a heap
+        # int64/float64 data travels through shared memory instead of pickled lists
+        n = len(arr)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or n < SortingAlgorithms.PARALLEL_MIN_SIZE:
+            return SORT_ALGORITHMS[engine](arr)
+        chunks = SortingAlgorithms._sort_chunks_in_pool(arr, workers, engine)
+        SortingAlgorithms._replace(arr, heapq.merge(*chunks))
+        return arr
+
+    @staticmethod
+    def _sort_chunks_in_pool(arr, workers, engine):
+        # one sorted chunk of arr per worker, sorted in worker processes
+        n = len(arr)
+        bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+        typecode = SortingAlgorithms._buffer_typecode(arr)
+        with ProcessPoolExecutor(max_workers=workers, initializer=exit_with_parent) as pool:
+            if typecode is None:
+                return list(pool.map(SortingAlgorithms._sort_chunk,
+                                     [arr[start:stop] for start, stop in bounds],
+                                     [engine] * workers))
+            return SortingAlgorithms._sort_chunks_shared(pool, arr, typecode, bounds, engine)
+
+    @staticmethod
+    def _buffer_typecode(arr):
+        # array typecode that can hold every element of arr, None if there is none
+        if all(type(x) is int for x in arr):
+            if arr and -(1 << 63) <= min(arr) and max(arr) < (1 << 63):
+                return "q"
+            return None
+        if all(type(x) is float for x in arr):
+            return "d"
+        return None
+
+    @staticmethod
+    def _sort_chunks_shared(pool, arr, typecode, bounds, engine):
+        # copy arr into shared memory once, let the workers sort their slices in place
+        # and return the sorted slices as lists
+        n = len(arr)
+        shm = shared_memory.SharedMemory(create=True, size=n * array(typecode).itemsize)
+        try:
+            view = shm.buf.cast(typecode)
+            try:
+                view[:n] = array(typecode, arr)
+                futures = [pool.submit(SortingAlgorithms._sort_shared_chunk,
+                                       shm.name, typecode, start, stop, engine)
+                           for start, stop in bounds]
+                for future in futures:
+                    future.result()
+                return [view[start:stop].tolist() for start, stop in bounds]
+            finally:
+                view.release()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    @staticmethod
+    def _sort_shared_chunk(shm_name, typecode, start, stop, engine):
+        # process pool worker: sort one slice of a shared memory buffer in place
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            view = shm.buf.cast(typecode)
+            try:
+                view[start:stop] = array(typecode, SORT_ALGORITHMS[engine](view[start:stop].tolist()))
+            finally:
+                view.release()
+        finally:
+            shm.close()
+
+    @staticmethod
+    def _sort_chunk(chunk, engine):
+        # process pool worker for data that does not fit a typed buffer
+        return SORT_ALGORITHMS[engine](chunk)
+
+    @staticmethod
+    def select_kth(arr, k):
+        # k-th smallest element (0-based) by introselect, arr is reordered in place so that
+        # arr[k] holds it with nothing larger before it and nothing smaller after it
+        n = len(arr)
+        if not 0 <= k < n:
+            raise IndexError(f"k={k} out of range for {n} elements")
+        lo, hi = 0, n - 1
+        depth_limit = 2 * (n.bit_length() - 1)
+        while hi - lo >= SortingAlgorithms.INSERTION_SORT_CUTOFF:
+            if depth_limit == 0:
+                # too many bad pivots, finish the remaining range in O(n log n)
+                SortingAlgorithms._heap_sort_range(arr, lo, hi)
+                return arr[k]
+            depth_limit -= 1
+            lt, gt = SortingAlgorithms._partition3(arr, lo, hi)
+            if k < lt:
+                hi = lt - 1
+            elif k > gt:
+                lo = gt + 1
+            else:
+                return arr[k]
+        SortingAlgorithms._insertion_sort_range(arr, lo, hi)
+        return arr[k]
+
+    @staticmethod
+    def partial_sort(arr, k):
+        # reorder arr in place so that arr[:k] holds its k smallest elements in sorted order
+        n = len(arr)
+        k = min(k, n)
+        if k <= 0:
+            return arr
+        if k < n:
+            SortingAlgorithms.select_kth(arr, k - 1)
+        SortingAlgorithms._introsort(arr, 0, k - 1, 2 * (k.bit_length() - 1))
+        return arr
+
+    @staticmethod
+    def nsmallest(arr, k, key=None):
+        # k smallest elements in ascending order, bounded heap of size k, arr is left untouched
+        return heapq.nsmallest(k, arr, key=key)
+
+    @staticmethod
+    def nlargest(arr, k, key=None):
+        # k largest elements in descending order, bounded heap of size k, arr is left untouched
+        return heapq.nlargest(k, arr, key=key)
+
+    @staticmethod
+    def sort_by_keys(arr, keys, algorithm="Merge Sort"):
+        # stable multi-key sort, keys are key functions or (key, reverse) pairs, most significant first
+        specs = [spec if isinstance(spec, tuple) else (spec, False) for spec in keys]
+        sort_func = SORT_ALGORITHMS[algorithm]
+        if len({reverse for _, reverse in specs}) <= 1 and algorithm not in ("Counting Sort", "Radix Sort"):
+            # one direction for every key, a single pass on the combined key does it
+            key_funcs = [key for key, _ in specs]
+            reverse = bool(specs) and specs[0][1]
+            return sort_func(arr, key=lambda x: tuple(key(x) for key in key_funcs), reverse=reverse)
+        # mixed directions or int-only keys, one stable pass per key from the least significant up
+        for key, reverse in reversed(specs):
+            arr = sort_func(arr, key=key, reverse=reverse)
+        return arr
+
+    @staticmethod
+    def sort_buffer(buf, algorithm="Quick Sort", **options):
+        # sort a typed contiguous buffer (array.array, 1-D memoryview, numpy array) in place with
+        # the selected engine and return buf itself, so callers keep their buffer type; options
+        # go to the engine (workers= for Parallel Merge Sort). array.array is sorted directly,
+        # other buffers too for the index-only engines, the rest sort a typed array copy that is
+        # written back. the comparison engines keep the values in typed arrays (their slices are
+        # arrays too), but Radix Sort, Counting Sort, Quick Sort (functional) and Parallel Merge
+        # Sort build python lists of the values along the way. NUMPY_SORT hands the buffer to numpy
+        if not isinstance(buf, array):
+            view = memoryview(buf)
+            if view.readonly or view.ndim != 1 or not view.c_contiguous:
+                raise ValueError("buffer must be writable, 1-D and contiguous")
+        if algorithm == SortingAlgorithms.NUMPY_SORT:
+            if np is None:
+                raise ValueError(f"{algorithm} needs numpy, which is not installed")
+            # np.asarray over the buffer protocol is a view, nothing is copied
+            np.asarray(memoryview(buf)).sort()
+            return buf
+        work = buf
+        if not isinstance(buf, array) and algorithm not in SortingAlgorithms.BUFFER_INDEX_ENGINES:
+            if view.format not in ARRAY_TYPECODES:
+                raise ValueError(f"{algorithm} cannot sort a buffer of format {view.format!r}")
+            work = array(view.format)
+            work.frombytes(view.cast('B'))
+        result = SORT_ALGORITHMS[algorithm](work, **options)
+        if result is not work:
+            # the functional quick sort returns a new list
+            work[:] = array(work.typecode, result)
+        if work is not buf:
+            view[:] = work
+        return buf
+
+    @staticmethod
+    def sort_many(lists, use_numpy=True):
+        # sort many independent lists in place in one call and return them; small lists are
+        # grouped by length and each group runs through one cached sorting network; with numpy,
+        # a large enough batch of the longer numeric ones is padded into one 2-D array and
+        # sorted row-wise; lists longer than SORT_MANY_MAX_LENGTH are quick sorted one by one
+        small = []
+        for arr in lists:
+            if len(arr) > SortingAlgorithms.SORT_MANY_MAX_LENGTH:
+                SortingAlgorithms.quick_sort(arr)
+            elif len(arr) > 1:
+                small.append(arr)
+        if use_numpy and np is not None:
+            wide = [arr for arr in small if len(arr) > SortingAlgorithms.SORT_MANY_NUMPY_MIN_LENGTH]
+            if (len(wide) >= SortingAlgorithms.SORT_MANY_NUMPY_MIN_BATCH
+                    and SortingAlgorithms._sort_many_numpy(wide)):
+                small = [arr for arr in small if len(arr) <= SortingAlgorithms.SORT_MANY_NUMPY_MIN_LENGTH]
+        by_length = {}
+        for arr in small:
+            by_length.setdefault(len(arr), []).append(arr)
+        for n, group in by_length.items():
+            network = SortingAlgorithms._sorting_network(n)
+            for arr in group:
+                for i, j in network:
+                    if arr[j] < arr[i]:
+                        arr[i], arr[j] = arr[j], arr[i]
+        return lists
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _sorting_network(n):
+        # comparator pairs of Batcher's odd-even merge sort for n inputs; the network for the
+        # next power of two with every comparator touching an index >= n dropped
+        pairs = []
+        p = 1
+        while p < n:
+            k = p
+            while k >= 1:
+                for j in range(k % p, n - k, 2 * k):
+                    for i in range(min(k, n - j - k)):
+                        if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                            pairs.append((i + j, i + j + k))
+                k //= 2
+            p *= 2
+        return tuple(pairs)
+
+    @staticmethod
+    def _sort_many_numpy(small):
+        # sort every list through one padded 2-D array, padding with the batch maximum so the
+        # padding ends up behind the real values; False when the values need more than one dtype
+        typecodes = {SortingAlgorithms._buffer_typecode(arr) for arr in small}
+        if len(typecodes) != 1 or None in typecodes:
+            return False
+        width = max(map(len, small))
+        pad = max(map(max, small))
+        batch = np.array([arr + [pad] * (width - len(arr)) for arr in small],
+                         dtype=np.int64 if typecodes == {"q"} else np.float64)
+        batch.sort(axis=1)
+        for arr, row in zip(small, batch.tolist()):
+            arr[:] = row[:len(arr)]
+        return True
+
+    @staticmethod
+    def external_sort(input_file, output_file, memory_budget=None, temp_dir=None, engine="Quick Sort"):
+        # sort a text file of integers (one per line) that does not have to fit in memory
+        # chunks of about memory_budget bytes are sorted with engine, spilled to binary run
+        # files in temp_dir and k-way merged into output_file; returns the number of values
+        memory_budget = memory_budget or SortingAlgorithms.EXTERNAL_SORT_DEFAULT_BUDGET
+        chunk_items = max(1, memory_budget // SortingAlgorithms.EXTERNAL_SORT_ITEM_BYTES)
+        total = 0
+        with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+            run_paths = []
+            with open(input_file, 'r') as src:
+                while True:
+                    # parse while reading, so no list of raw lines is held next to the values
+                    chunk = [int(line) for line in itertools.islice(src, chunk_items) if line.strip()]
+                    if not chunk:
+                        break
+                    chunk = SORT_ALGORITHMS[engine](chunk)
+                    path = os.path.join(run_dir, f"run_{len(run_paths)}.bin")
+                    with open(path, 'wb') as run:
+                        array("q", chunk).tofile(run)
+                    run_paths.append(path)
+                    total += len(chunk)
+            # split the budget between one read buffer per run and the output
+            block_items = max(1, chunk_items // (len(run_paths) + 1))
+            with ExitStack() as stack, open(output_file, 'w') as out:
+                streams = [SortingAlgorithms._read_run(stack.enter_context(open(path, 'rb')), block_items)
+                           for path in run_paths]
+                for block in SortingAlgorithms._batched(heapq.merge(*streams), block_items):
+                    out.write("".join(f"{value}\n" for value in block))
+        return total
+
+    @staticmethod
+    def _read_run(run, block_items):
+        # stream the int64 values of a binary run file, block_items at a time
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(run, block_items)
+            except EOFError:
+                yield from block
+                return
+            yield from block
+
+    @staticmethod
+    def _batched(iterable, size):
+        # yield lists of up to size items from iterable
+        iterator = iter(iterable)
+        while True:
+            batch = list(itertools.islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def profile_input(arr):
+        # cheap O(n) pass over the input: size, range, sortedness and duplicates
+        n = len(arr)
+        profile = {"size": n, "integer": all(type(x) is int for x in arr),
+                   "min": None, "max": None, "runs": SortingAlgorithms.count_runs(arr),
+                   "duplicate_ratio": 0.0}
+        if n:
+            profile["min"] = min(arr)
+            profile["max"] = max(arr)
+            sample_size = min(n, SortingAlgorithms.AUTO_SAMPLE_SIZE)
+            step = max(1, n // sample_size)
+            sample = arr[::step][:sample_size]
+            profile["duplicate_ratio"] = 1 - len(set(sample)) / len(sample)
+        return profile
+
+    @staticmethod
+    def choose_algorithm(arr):
+        # pick an entry of SORT_ALGORITHMS for arr, returns (name, reason)
+        profile = SortingAlgorithms.profile_input(arr)
+        n = profile["size"]
+        if n <= SortingAlgorithms.INSERTION_SORT_CUTOFF:
+            return "Insertion Sort", f"tiny input ({n} elements)"
+        if profile["runs"] * SortingAlgorithms.AUTO_PRESORTED_RUN_LENGTH <= n:
+            return "Natural Merge Sort", f"presorted input ({profile['runs']} natural runs)"
+        if profile["integer"]:
+            value_range = profile["max"] - profile["min"] + 1
+            if value_range <= SortingAlgorithms.COUNTING_SORT_MAX_RANGE_RATIO * n:
+                return "Counting Sort", f"dense integer range ({value_range} values for {n} elements)"
+            if SortingAlgorithms._radix_numpy_fits(n, profile["min"], profile["max"]):
+                return "Radix Sort", f"sparse int64 range ({value_range} values for {n} elements), numpy radix"
+            passes = -(-(value_range - 1).bit_length() // 8)
+            if passes <= SortingAlgorithms.AUTO_RADIX_MAX_PASSES:
+                return "Radix Sort", f"sparse integer range ({value_range} values for {n} elements), {passes} passes"
+        if profile["duplicate_ratio"] > 0.5:
+            return "Quick Sort", f"duplicate-heavy input ({profile['duplicate_ratio']:.0%} repeats), 3-way introsort"
+        return "Quick Sort", "general input, introsort"
+
+    @staticmethod
+    def count_runs(arr):
+        # number of maximal non-descending or strictly descending runs in arr
+        n = len(arr)
+        if n == 0:
+            return 0
+        runs = 0
+        i = 0
+        while i < n:
+            runs += 1
+            i += 1
+            if i == n:
+                break
+            if arr[i] < arr[i - 1]:
+                while i + 1 < n and arr[i + 1] < arr[i]:
+                    i += 1
+            else:
+                while i + 1 < n and not arr[i + 1] < arr[i]:
+                    i += 1
+            i += 1
+        return runs
+
+    @staticmethod
+    def _min_run_length(n):
+        # minimum run length so that n / min_run is close to a power of two
+        r = 0
+        while n >= 64:
+            r |= n & 1
+            n >>= 1
+        return n + r
+
+    @staticmethod
+    def _count_run_and_make_ascending(arr, lo, n):
+        # length of the run starting at lo, strictly descending runs are reversed in place
+        hi = lo + 1
+        if hi == n:
+            return 1
+        if arr[hi] < arr[lo]:
+            while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                hi += 1
+            arr[lo:hi + 1] = arr[lo:hi + 1][::-1]
+        else:
+            while hi + 1 < n and not arr[hi + 1] < arr[hi]:
+                hi += 1
+        return hi - lo + 1
+
+    @staticmethod
+    def _binary_insertion_sort(arr, lo, hi, start):
+        # sort arr[lo:hi] given that arr[lo:start] is already sorted
+        for i in range(start, hi):
+            pivot = arr[i]
+            pos = bisect.bisect_right(arr, pivot, lo, i)
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = pivot
+
+    @staticmethod
+    def _merge_collapse(arr, runs):
+        # merge runs on top of the stack until the timsort length invariants hold
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                    or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            SortingAlgorithms._merge_at(arr, runs, i)
+
+    @staticmethod
+    def _merge_at(arr, runs, i):
+        # merge stack entries i and i+1, which are adjacent in arr
+        start, length = runs[i]
+        mid = start + length
+        hi = mid + runs[i + 1][1]
+        SortingAlgorithms._gallop_merge(arr, start, mid, hi)
+        runs[i][1] = hi - start
+        del runs[i + 1]
+
+    @staticmethod
+    def _gallop_merge(arr, lo, mid, hi):
+        # stable merge of arr[lo:mid] and arr[mid:hi], switching to galloping
+        # when one side keeps winning
+        lo = SortingAlgorithms._gallop_right(arr[mid], arr, lo, mid)
+        if lo == mid:
+            return
+        hi = SortingAlgorithms._gallop_left(arr[mid - 1], arr, mid, hi)
+        temp = arr[lo:mid]
+        left_len = len(temp)
+        i, j, k = 0, mid, lo
+        while i < left_len and j < hi:
+            left_wins = right_wins = 0
+            while (i < left_len and j < hi and left_wins < SortingAlgorithms.MIN_GALLOP
+                   and right_wins < SortingAlgorithms.MIN_GALLOP):
+                if arr[j] < temp[i]:
+                    arr[k] = arr[j]
+                    j += 1
+                    right_wins += 1
+                    left_wins = 0
+                else:
+                    arr[k] = temp[i]
+                    i += 1
+                    left_wins += 1
+                    right_wins = 0
+                k += 1
+            if i == left_len or j == hi:
+                break
+            # galloping mode, copy whole stretches found by exponential search
+            end = SortingAlgorithms._gallop_right(arr[j], temp, i, left_len)
+            arr[k:k + end - i] = temp[i:end]
+            k += end - i
+            i = end
+            if i == left_len:
+                break
+            end = SortingAlgorithms._gallop_left(temp[i], arr, j, hi)
+            arr[k:k + end - j] = arr[j:end]
+            k += end - j
+            j = end
+        # leftover right run elements are already in place
+        arr[k:k + left_len - i] = temp[i:]
+
+    @staticmethod
+    def _gallop_right(key, a, lo, hi):
+        # first index in a[lo:hi] holding an element greater than key
+        if lo >= hi or key < a[lo]:
+            return lo
+        prev, step = lo, 1
+        while prev + step < hi and not key < a[prev + step]:
+            prev += step
+            step *= 2
+        return bisect.bisect_right(a, key, prev + 1, min(prev + step, hi))
+
+    @staticmethod
+    def _gallop_left(key, a, lo, hi):
+        # first index in a[lo:hi] holding an element not less than key
+        if lo >= hi or not a[lo] < key:
+            return lo
+        prev, step = lo, 1
+        while prev + step < hi and a[prev + step] < key:
+            prev += step
+            step *= 2
+        return bisect.bisect_left(a, key, prev + 1, min(prev + step, hi))
+
+    @staticmethod
+    @keyed
+    def quick_sort(arr):
+        # in-place introsort: median-of-three pivot, 3-way partition,
+        # insertion sort for small ranges and heapsort once recursion gets too deep
+        if len(arr) > 1:
+            depth_limit = 2 * (len(arr).bit_length() - 1)
+            SortingAlgorithms._introsort(arr, 0, len(arr) - 1, depth_limit)
+        return arr
+
+    @staticmethod
+    def _introsort(arr, lo, hi, depth_limit):
+        # sort arr[lo..hi], recursing on the smaller side to keep the stack O(log n)
+        while hi - lo >= SortingAlgorithms.INSERTION_SORT_CUTOFF:
+            if depth_limit == 0:
+                SortingAlgorithms._heap_sort_range(arr, lo, hi)
+                return
+            depth_limit -= 1
+            lt, gt = SortingAlgorithms._partition3(arr, lo, hi)
+            if lt - lo < hi - gt:
+                SortingAlgorithms._introsort(arr, lo, lt - 1, depth_limit)
+                lo = gt + 1
+            else:
+                SortingAlgorithms._introsort(arr, gt + 1, hi, depth_limit)
+                hi = lt - 1
+        SortingAlgorithms._insertion_sort_range(arr, lo, hi)
+
+    @staticmethod
+    def _partition3(arr, lo, hi):
+        # dutch flag partition around the median of first, middle and last
+        # returns (lt, gt) so that arr[lt..gt] holds every element equal to the pivot
+        a, b, c = arr[lo], arr[(lo + hi) // 2], arr[hi]
+        if a < b:
+            pivot = b if b < c else (c if a < c else a)
+        else:
+            pivot = a if a < c else (c if b < c else b)
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            value = arr[i]
+            if value < pivot:
+                arr[lt], arr[i] = value, arr[lt]
+                lt += 1
+                i += 1
+            elif pivot < value:
+                arr[gt], arr[i] = value, arr[gt]
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt
+
+    @staticmethod
+    def _insertion_sort_range(arr, lo, hi):
+        # insertion sort restricted to arr[lo..hi]
+        for i in range(lo + 1, hi + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and key < arr[j]:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    @staticmethod
+    def _heap_sort_range(arr, lo, hi):
+        # heapsort restricted to arr[lo..hi], used when introsort recursion gets too deep
+        n = hi - lo + 1
+        for start in range(n // 2 - 1, -1, -1):
+            SortingAlgorithms._sift_down(arr, lo, start, n)
+        for end in range(n - 1, 0, -1):
+            arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+            SortingAlgorithms._sift_down(arr, lo, 0, end)
+
+    @staticmethod
+    def _sift_down(arr, offset, root, size):
+        # restore the max-heap property below root for a heap stored at arr[offset:offset+size]
+        value = arr[offset + root]
+        child = 2 * root + 1
+        while child < size:
+            if child + 1 < size and arr[offset + child] < arr[offset + child + 1]:
+                child += 1
+            if not value < arr[offset + child]:
+                break
+            arr[offset + root] = arr[offset + child]
+            root = child
+            child = 2 * root + 1
+        arr[offset + root] = value
+
+    @staticmethod
+    @keyed
+    def quick_sort_functional(arr):
+        # quick sort with middle element as pivot, building new lists at every level
+        return SortingAlgorithms._quick_sort_functional(arr)
+
+    @staticmethod
+    def _quick_sort_functional(arr):
+        # recursive body of quick_sort_functional, outside the key= wrapper
+        if len(arr) <= 1:
+            return arr
+        pivot = arr[len(arr)//2]
+        left = [x for x in arr if x < pivot]
+        middle = [x for x in arr if x == pivot]
+        right = [x for x in arr if x > pivot]
+        return (SortingAlgorithms._quick_sort_functional(left) + middle
+                + SortingAlgorithms._quick_sort_functional(right))
+
+    @staticmethod
+    @counting_keyed
+    def counting_sort(arr):
+        # counting sort for integer lists with known range
+        if not arr:
+            return arr
+        max_val = max(arr)
+        min_val = min(arr)
+        value_range = max_val - min_val + 1
+        if value_range > max(SortingAlgorithms.COUNTING_SORT_MAX_RANGE_RATIO * len(arr),
+                             SortingAlgorithms.COUNTING_SORT_MIN_RANGE):
+            # sparse range, the count array would dwarf the input
+            return SortingAlgorithms.radix_sort(arr)
+        count = [0] * value_range
+        for num in arr:
+            count[num - min_val] += 1
+        sorted_arr = []
+        for i in range(len(count)):
+            sorted_arr.extend([i + min_val] * count[i])
+        return sorted_arr
+
+    @staticmethod
+    @integer_keyed
+    def radix_sort(arr):
+        # LSD radix sort on integers, one byte per pass
+        # negatives are handled by biasing every value with the minimum
+        if len(arr) <= 1:
+            return arr
+        min_val = min(arr)
+        max_val = max(arr)
+        span = max_val - min_val
+        if SortingAlgorithms._radix_numpy_fits(len(arr), min_val, max_val):
+            SortingAlgorithms._replace(arr, SortingAlgorithms._radix_sort_numpy(arr, min_val, span))
+            return arr
+        values = [num - min_val for num in arr]
+        shift = 0
+        while span >> shift:
+            buckets = [[] for _ in range(256)]
+            for value in values:
+                buckets[(value >> shift) & 0xFF].append(value)
+            values = [value for bucket in buckets for value in bucket]
+            shift += 8
+        SortingAlgorithms._replace(arr, [value + min_val for value in values])
+        return arr
+
+    @staticmethod
+    def _replace(arr, values):
+        # arr[:] = values for lists and array.array alike, an array slice only takes an array
+        arr[:] = array(arr.typecode, values) if isinstance(arr, array) else values
+
+    @staticmethod
+    def _radix_numpy_fits(n, min_val, max_val):
+        # whether radix sort takes the numpy path: numpy present, enough elements, and the
+        # values and their span within int64
+        return (np is not None and n >= SortingAlgorithms.RADIX_NUMPY_THRESHOLD
+                and -(1 << 63) <= min_val and max_val < (1 << 63) and max_val - min_val < (1 << 63))
+
+    @staticmethod
+    def _radix_sort_numpy(arr, min_val, span):
+        # vectorized radix passes, a stable argsort on one byte is a counting sort
+        values = (np.array(arr, dtype=np.int64) - np.int64(min_val)).astype(np.uint64)
+        shift = 0
+        while span >> shift:
+            digits = ((values >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+            values = values[np.argsort(digits, kind="stable")]
+            shift += 8
+        return (values.astype(np.int64) + np.int64(min_val)).tolist()
+
+# display name -> sorting function, shared by every tab that offers a sort
+SORT_ALGORITHMS = {
+    "Bubble Sort": SortingAlgorithms.bubble_sort,
+    "Insertion Sort": SortingAlgorithms.insertion_sort,
+    "Merge Sort": SortingAlgorithms.merge_sort,
+    "Merge Sort (bottom-up)": SortingAlgorithms.bottom_up_merge_sort,
+    "Natural Merge Sort": SortingAlgorithms.natural_merge_sort,
+    "Quick Sort": SortingAlgorithms.quick_sort,
+    "Quick Sort (functional)": SortingAlgorithms.quick_sort_functional,
+    "Counting Sort": SortingAlgorithms.counting_sort,
+    "Radix Sort": SortingAlgorithms.radix_sort,
+    "Parallel Merge Sort": SortingAlgorithms.parallel_merge_sort,
+    "Auto": SortingAlgorithms.auto_sort,
+}
+
+# display name -> selection function taking (arr, k), offered next to the full sorts
+SELECTION_ALGORITHMS = {
+    "Select k-th": SortingAlgorithms.select_kth,
+    "Partial Sort": SortingAlgorithms.partial_sort,
+    "N Smallest": SortingAlgorithms.nsmallest,
+    "N Largest": SortingAlgorithms.nlargest,
+}
+
+class SortCounter:
+    # instrumentation mode for the sorting engines: counts comparisons, element writes
+    # (swaps count as two), lists allocated from the input and recursion depth of one run;
+    # the engines themselves are untouched, so there is no overhead when it is not used.
+    # writes and allocations are only seen on the counted input buffer and the lists sliced
+    # from it, so engines that build lists any other way report None for both rather than a
+    # misleading 0, and work sent to other processes leaves the comparisons uncounted as well.
+    # sorts outside SortingAlgorithms (LinkedList.sort relinking nodes, ...) only get their
+    # comparisons counted; writes, allocations, calls and depth are None for them
+    
+    # engine bodies that build their lists with comprehensions, count arrays or buckets
+    UNCOUNTED_LIST_ENGINES = ("counting_sort", "radix_sort", "_quick_sort_functional")
+    # engine bodies that hand the elements to worker processes
+    OTHER_PROCESS_ENGINES = ("_sort_chunks_in_pool",)
+    
+    class Value:
+        # wraps one element and counts every comparison made on it
+        __slots__ = ("value", "counter")
+        
+        def __init__(self, value, counter):
+            self.value = value
+            self.counter = counter
+        
+        def __lt__(self, other):
+            self.counter.comparisons += 1
+            return self.value < other.value
+        
+        def __le__(self, other):
+            self.counter.comparisons += 1
+            return self.value <= other.value
+        
+        def __gt__(self, other):
+            self.counter.comparisons += 1
+            return self.value > other.value
+        
+        def __ge__(self, other):
+            self.counter.comparisons += 1
+            return self.value >= other.value
+        
+        def __eq__(self, other):
+            self.counter.comparisons += 1
+            return self.value == other.value
+        
+        def __hash__(self):
+            return hash(self.value)
+        
+        def __reduce__(self):
+            # worker processes get the plain value, their comparisons cannot be counted here
+            return SortCounter._plain, (self.value,)
+    
+    class Buffer(list):
+        # list that counts element writes and the lists sliced, copied or concatenated from it
+        __slots__ = ("counter",)
+        
+        def __init__(self, iterable, counter):
+            super().__init__(iterable)
+            self.counter = counter
+        
+        def __setitem__(self, index, value):
+            if isinstance(index, slice):
+                value = list(value)
+                self.counter.writes += len(value)
+            else:
+                self.counter.writes += 1
+            super().__setitem__(index, value)
+        
+        def __getitem__(self, index):
+            result = super().__getitem__(index)
+            if isinstance(index, slice):
+                self.counter.allocations += 1
+                return SortCounter.Buffer(result, self.counter)
+            return result
+        
+        def __add__(self, other):
+            self.counter.allocations += 1
+            return SortCounter.Buffer(list.__add__(self, other), self.counter)
+        
+        def copy(self):
+            self.counter.allocations += 1
+            return SortCounter.Buffer(self, self.counter)
+        
+        def __reduce__(self):
+            # worker processes get a plain list
+            return list, (list(self),)
+    
+    @staticmethod
+    def _plain(value):
+        # unpickles a Value as the value it wraps
+        return value
+    
+    def __init__(self):
+        # start with all counters at zero
+        self.comparisons = 0
+        self.writes = 0
+        self.allocations = 0
+        self.calls = 0
+        self.max_depth = 0
+        self.lists_counted = True
+        self.in_process = True
+        self.engine_seen = False
+        self._depth = {}
+        self._engine_codes = {}
+        for name, attr in vars(SortingAlgorithms).items():
+            func = getattr(attr, "__func__", None)
+            if func is not None:
+                self._engine_codes[getattr(func, "__wrapped__", func).__code__] = name
+    
+    def run(self, sort_func, arr):
+        # sort a copy of arr with sort_func while counting, returns the plain result
+        if sort_func is SortingAlgorithms.auto_sort:
+            # decide on the raw data, the wrapped values would look non-integer
+            sort_func = SORT_ALGORITHMS[SortingAlgorithms.choose_algorithm(arr)[0]]
+        # counting and radix sort do arithmetic on the values, so they only get a counted buffer
+        wrap = sort_func not in (SortingAlgorithms.counting_sort, SortingAlgorithms.radix_sort)
+        data = SortCounter.Buffer((SortCounter.Value(x, self) for x in arr) if wrap else arr, self)
+        sys.setprofile(self._profile)
+        try:
+            result = sort_func(data)
+        finally:
+            sys.setprofile(None)
+        if not isinstance(result, list):
+            return result.value if wrap and isinstance(result, SortCounter.Value) else result
+        if not wrap:
+            return list(result)
+        # elements that came back from worker processes are plain values already
+        return [x.value if isinstance(x, SortCounter.Value) else x for x in result]
+    
+    def _profile(self, frame, event, arg):
+        # count engine calls and track how deeply each engine function nests within itself,
+        # the recursion depth; helpers called from an engine do not add to it
+        name = self._engine_codes.get(frame.f_code)
+        if name is None:
+            return
+        if event == "call":
+            self.engine_seen = True
+            self.calls += 1
+            depth = self._depth.get(frame.f_code, 0) + 1
+            self._depth[frame.f_code] = depth
+            self.max_depth = max(self.max_depth, depth)
+            if name in self.UNCOUNTED_LIST_ENGINES:
+                self.lists_counted = False
+            elif name in self.OTHER_PROCESS_ENGINES:
+                self.in_process = False
+        elif event == "return":
+            self._depth[frame.f_code] = self._depth.get(frame.f_code, 1) - 1
+    
+    def as_dict(self):
+        # counters as a plain dict, for reports and JSON output; None marks a counter this run
+        # could not measure
+        lists_counted = self.lists_counted and self.in_process and self.engine_seen
+        return {"comparisons": self.comparisons if self.in_process else None,
+                "writes": self.writes if lists_counted else None,
+                "allocations": self.allocations if lists_counted else None,
+                "calls": self.calls if self.engine_seen else None,
+                "max_depth": self.max_depth if self.engine_seen else None}
+    
+    def summary(self):
+        # short one-line report of the counters, n/a for the ones that were not measured
+        counts = {name: "n/a" if value is None else value for name, value in self.as_dict().items()}
+        return (f"comparisons={counts['comparisons']}, writes={counts['writes']}, "
+                f"allocations={counts['allocations']}, calls={counts['calls']}, depth={counts['max_depth']}")
+
+class LinkedList:
+    #class implementing singly linked list functionality
+    
+    # bytes read per block by the bulk loader
+    LOAD_BLOCK_SIZE = 1 << 20
+    
+    class Node:
+        # nested class for linked list nodes
+        def __init__(self, data):
+            self.data = data
+            self.next = None
+    
+    def __init__(self):
+        # initialize empty linked list
+        self.head = None
+        self.tail = None
+        self.size = 0
+    
+    def insert_at_head(self, data):
+        # insert new node at the beginning of the list
+        new_node = self.Node(data)
+        new_node.next = self.head
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.size += 1
+    
+    def append(self, data):
+        # insert new node at the end of the list in O(1) through the tail pointer
+        new_node = self.Node(data)
+        if self.tail is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+    
+    def extend(self, iterable):
+        # append every item of iterable in order; the list stays consistent if iterable raises
+        node_class = self.Node
+        tail = self.tail
+        count = 0
+        try:
+            for data in iterable:
+                node = node_class(data)
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+                count += 1
+        finally:
+            self.tail = tail
+            self.size += count
+    
+    def load_from_file(self, filename):
+        # load list data from file (whitespace separated integers, usually one per line),
+        # appended in file order
+        try:
+            with open(filename, 'rb') as file:
+                self.load_stream(file)
+            return True
+        except Exception as e:
+            print(f"error loading file: {e}")
+            return False
+    
+    def load_stream(self, source, block_size=LOAD_BLOCK_SIZE, chunks=False):
+        # append every integer of source in order without holding the source in memory;
+        # source is a file object, read in blocks of block_size whose numbers may span block
+        # boundaries, or any iterable of str or bytes items. by default each item ends at a
+        # separator (lines: ['1', '2', '3'] loads as 1, 2, 3); with chunks=True the items are
+        # raw blocks whose numbers may span items ([b'12', b'3 4'] loads as 123, 4)
+        self.extend(itertools.chain.from_iterable(LinkedList.integer_batches(source, block_size, chunks)))
+    
+    @staticmethod
+    def integer_batches(source, block_size=LOAD_BLOCK_SIZE, chunks=False):
+        # the integers of source (see load_stream), one parsed list per block or item
+        if hasattr(source, "read"):
+            source = iter(functools.partial(source.read, block_size), source.read(0))
+        elif not chunks:
+            for item in source:
+                yield [int(token) for token in item.split()]
+            return
+        leftover = None
+        for chunk in source:
+            if leftover:
+                chunk = leftover + chunk
+            tokens = chunk.split()
+            # a block that does not end in whitespace may end in the middle of a number
+            leftover = tokens.pop() if tokens and not chunk[-1:].isspace() else None
+            yield [int(token) for token in tokens]
+        if leftover:
+            yield [int(leftover)]
+    
+    def minimum(self):
+        # find minimum value in the list
+        if not self.head:
+            return None
+        current = self.head
+        min_val = current.data
+        while current:
+            if current.data < min_val:
+                min_val = current.data
+            current = current.next
+        return min_val
+    
+    def maximum(self):
+        # find maximum value in the list
+        if not self.head:
+            return None
+        current = self.head
+        max_val = current.data
+        while current:
+            if current.data > max_val:
+                max_val = current.data
+            current = current.next
+        return max_val
+    
+    def search(self, value):
+        # search for value in the list
+        current = self.head
+        while current:
+            if current.data == value:
+                return current
+            current = current.next
+        return None
+    
+    def predecessor(self, value):
+        # find predecessor of given value
+        if not self.head or self.head.data == value:
+            return None
+        prev = None
+        current = self.head
+        while current and current.data != value:
+            prev = current
+            current = current.next
+        if not current:
+            return None
+        return prev.data if prev else None
+    
+    def successor(self, value):
+        # find successor of given value
+        node = self.search(value)
+        if not node or not node.next:
+            return None
+        return node.next.data
+    
+    def to_list(self):
+        # convert linked list to python list
+        result = []
+        current = self.head
+        while current:
+            result.append(current.data)
+            current = current.next
+        return result
+    
+    def sort(self):
+        # stable in-place merge sort that relinks the existing nodes: strictly descending runs
+        # are reversed first, then every pass merges neighbouring natural runs until one is left;
+        # O(1) extra memory, one pass over presorted or reversed input
+        if self.head is None:
+            return self
+        self.head = self._reverse_descending_runs(self.head)
+        while True:
+            sentinel = tail = self.Node(None)
+            current = self.head
+            merges = 0
+            while current:
+                first, current = self._take_run(current)
+                second = None
+                if current:
+                    second, current = self._take_run(current)
+                tail.next, tail = self._merge_runs(first, second)
+                merges += 1
+            self.head = sentinel.next
+            if merges == 1:
+                self.tail = tail
+                return self
+    
+    @staticmethod
+    def _take_run(head):
+        # cut the non-descending run starting at head off the list, returns (head, rest)
+        node = head
+        while node.next and not node.next.data < node.data:
+            node = node.next
+        rest = node.next
+        node.next = None
+        return head, rest
+    
+    @staticmethod
+    def _merge_runs(a, b):
+        # stable merge of two sorted runs (b may be None), returns (head, tail)
+        sentinel = tail = LinkedList.Node(None)
+        while a and b:
+            if b.data < a.data:
+                tail.next, b = b, b.next
+            else:
+                tail.next, a = a, a.next
+            tail = tail.next
+        tail.next = a or b
+        while tail.next:
+            tail = tail.next
+        return sentinel.next, tail
+    
+    @staticmethod
+    def _reverse_descending_runs(head):
+        # reverse every strictly descending run in place (strictly, so equal values keep their
+        # order), returns the new head
+        sentinel = tail = LinkedList.Node(None)
+        current = head
+        while current:
+            run_head = current
+            if current.next and current.next.data < current.data:
+                previous = None
+                while True:
+                    following = current.next
+                    current.next = previous
+                    previous = current
+                    if following is None or not following.data < current.data:
+                        break
+                    current = following
+                tail.next, tail = previous, run_head
+                current = following
+            else:
+                while current.next and not current.next.data < current.data:
+                    current = current.next
+                tail.next, tail = run_head, current
+                current = current.next
+        tail.next = None
+        return sentinel.next
+
+class UnrolledLinkedList:
+    # singly linked list of blocks that each hold up to BLOCK_CAPACITY int64 values in an array;
+    # same API as LinkedList for integers at a fraction of the memory per element, and the scans
+    # run over whole arrays in C instead of chasing one pointer per value
+    
+    BLOCK_CAPACITY = 64
+    
+    class _Block:
+        # fixed-capacity node holding a run of consecutive values
+        __slots__ = ("values", "next")
+        
+        def __init__(self, values=()):
+            self.values = array('q', values)
+            self.next = None
+    
+    def __init__(self):
+        # initialize empty list; no block is ever left empty
+        self.head = None
+        self.tail = None
+        self.size = 0
+    
+    def _blocks(self):
+        # iterate over the blocks from head to tail
+        block = self.head
+        while block:
+            yield block
+            block = block.next
+    
+    def insert_at_head(self, data):
+        # insert value at the beginning, in the head block while it has room
+        if self.head is not None and len(self.head.values) < self.BLOCK_CAPACITY:
+            self.head.values.insert(0, data)
+        else:
+            block = self._Block((data,))
+            block.next = self.head
+            self.head = block
+            if self.tail is None:
+                self.tail = block
+        self.size += 1
+    
+    def delete_at_head(self):
+        # remove and return the first value, None if the list is empty
+        if self.head is None:
+            return None
+        data = self.head.values.pop(0)
+        if not self.head.values:
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+        self.size -= 1
+        return data
+    
+    def append(self, data):
+        # insert value at the end, in the tail block while it has room
+        if self.tail is not None and len(self.tail.values) < self.BLOCK_CAPACITY:
+            self.tail.values.append(data)
+        else:
+            block = self._Block((data,))
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+        self.size += 1
+    
+    def extend(self, iterable):
+        # append every value of iterable in order, filling whole blocks at a time
+        iterator = iter(iterable)
+        if self.tail is not None and len(self.tail.values) < self.BLOCK_CAPACITY:
+            values = self.tail.values
+            before = len(values)
+            try:
+                values.extend(itertools.islice(iterator, self.BLOCK_CAPACITY - before))
+            finally:
+                self.size += len(values) - before
+        while True:
+            block = self._Block(itertools.islice(iterator, self.BLOCK_CAPACITY))
+            if not block.values:
+                return
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+            self.size += len(block.values)
+    
+    def load_from_file(self, filename):
+        # load list data from file (whitespace separated integers), appended in file order
+        try:
+            with open(filename, 'rb') as file:
+                self.load_stream(file)
+            return True
+        except Exception as e:
+            print(f"error loading file: {e}")
+            return False
+    
+    def load_stream(self, source, block_size=LinkedList.LOAD_BLOCK_SIZE, chunks=False):
+        # append every integer of source in order, see LinkedList.load_stream
+        for batch in LinkedList.integer_batches(source, block_size, chunks):
+            self.extend(batch)
+    
+    def minimum(self):
+        # find minimum value in the list
+        if not self.head:
+            return None
+        return min(min(block.values) for block in self._blocks())
+    
+    def maximum(self):
+        # find maximum value in the list
+        if not self.head:
+            return None
+        return max(max(block.values) for block in self._blocks())
+    
+    @staticmethod
+    def _find(values, needle):
+        # index of the first value whose int64 bytes are needle, -1 if absent; bytes.find scans
+        # in C without boxing every value, matches off an item boundary are skipped
+        data = values.tobytes()
+        offset = data.find(needle)
+        while offset >= 0 and offset % values.itemsize:
+            offset = data.find(needle, offset + 1)
+        return offset // values.itemsize if offset >= 0 else -1
+    
+    def _locate(self, value):
+        # (previous block, block, index) of the first occurrence of value, block None if absent
+        try:
+            needle = array('q', (value,)).tobytes()
+        except OverflowError:
+            return None, None, -1  # no int64 equals it
+        except TypeError:
+            needle = None  # not an integer, compare value by value
+        previous = None
+        for block in self._blocks():
+            if needle is not None:
+                index = self._find(block.values, needle)
+            else:
+                index = block.values.index(value) if value in block.values else -1
+            if index >= 0:
+                return previous, block, index
+            previous = block
+        return None, None, -1
+    
+    def search(self, value):
+        # whether value is in the list; the blocks stay internal
+        return self._locate(value)[1] is not None
+    
+    def predecessor(self, value):
+        # find predecessor of the first occurrence of value
+        previous, block, index = self._locate(value)
+        if block is None:
+            return None
+        if index:
+            return block.values[index - 1]
+        return previous.values[-1] if previous else None
+    
+    def successor(self, value):
+        # find successor of the first occurrence of value
+        _, block, index = self._locate(value)
+        if block is None:
+            return None
+        if index + 1 < len(block.values):
+            return block.values[index + 1]
+        return block.next.values[0] if block.next else None
+    
+    def to_list(self):
+        # convert unrolled linked list to python list
+        result = []
+        for block in self._blocks():
+            result.extend(block.values)
+        return result
+
+class SkipList:
+    # sorted linked list with a skip-list index over it: level 0 is a chain of LinkedList nodes in
+    # ascending order (head, tail and size as in LinkedList), and each node also links forward on
+    # a random number of levels above, every level holding about half the nodes of the one below;
+    # insert, delete, search, floor, ceiling and range starts descend from the top level in
+    # O(log n) expected steps. levels come from random.Random(seed), so a seed and an insertion
+    # order always rebuild the same index
+    
+    MAX_LEVEL = 32
+    
+    class Node(LinkedList.Node):
+        # list node plus its links on the upper levels, forward[i] is level i + 1; about half
+        # the nodes are on level 0 only and share an empty tuple instead of an empty list
+        def __init__(self, data, height=0):
+            super().__init__(data)
+            self.forward = [None] * height if height else ()
+    
+    def __init__(self, seed=None):
+        # initialize empty skip list; header is the sentinel before the first node on every level
+        self.rng = random.Random(seed)
+        self.header = self.Node(None)
+        self.header.forward = []  # grows and shrinks with the index
+        self.head = None
+        self.tail = None
+        self.size = 0
+    
+    def levels(self):
+        # number of levels in use, level 0 included
+        return len(self.header.forward) + 1
+    
+    def _random_height(self):
+        # upper levels of a new node, each one with probability 1/2: the trailing one bits of a
+        # random word
+        bits = self.rng.getrandbits(self.MAX_LEVEL - 1)
+        return (~bits & (bits + 1)).bit_length() - 1
+    
+    def _path(self, value, inclusive=False):
+        # last node before value on every upper level and on level 0, the header when there is
+        # none; nodes equal to value count as before it when inclusive
+        update = [self.header] * len(self.header.forward)
+        node = self.header
+        for level in reversed(range(len(update))):
+            ahead = node.forward[level]
+            while ahead is not None and (ahead.data < value or inclusive and ahead.data == value):
+                node = ahead
+                ahead = node.forward[level]
+            update[level] = node
+        ahead = node.next
+        while ahead is not None and (ahead.data < value or inclusive and ahead.data == value):
+            node = ahead
+            ahead = node.next
+        return update, node
+    
+    def _add_levels(self, update, height):
+        # grow the index to height upper levels, the new levels start at the header
+        while len(self.header.forward) < height:
+            self.header.forward.append(None)
+            update.append(self.header)
+    
+    def insert(self, data):
+        # insert value in sorted position, before any equal values
+        update, node = self._path(data)
+        new_node = self.Node(data, self._random_height())
+        self._add_levels(update, len(new_node.forward))
+        for level in range(len(new_node.forward)):
+            new_node.forward[level] = update[level].forward[level]
+            update[level].forward[level] = new_node
+        new_node.next = node.next
+        node.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        self.head = self.header.next
+        self.size += 1
+    
+    def extend(self, iterable):
+        # insert every value; sorted first, so values from the current maximum on are linked at
+        # the tail in one pass instead of one descent each
+        values = sorted(iterable)
+        if self.tail is not None and values and values[0] < self.tail.data:
+            for value in values:
+                self.insert(value)
+            return
+        update = [self.header] * len(self.header.forward)
+        node = self.header
+        for level in reversed(range(len(update))):
+            while node.forward[level] is not None:
+                node = node.forward[level]
+            update[level] = node
+        last = self.tail or self.header
+        for value in values:
+            new_node = self.Node(value, self._random_height())
+            self._add_levels(update, len(new_node.forward))
+            for level in range(len(new_node.forward)):
+                update[level].forward[level] = new_node
+                update[level] = new_node
+            last.next = new_node
+            last = new_node
+        if values:
+            self.tail = last
+            self.head = self.header.next
+            self.size += len(values)
+    
+    def delete(self, data):
+        # remove one occurrence of value, False if it is not in the list
+        update, node = self._path(data)
+        target = node.next
+        if target is None or target.data != data:
+            return False
+        for level in range(len(target.forward)):
+            update[level].forward[level] = target.forward[level]
+        node.next = target.next
+        if self.tail is target:
+            self.tail = node if node is not self.header else None
+        self.head = self.header.next
+        self.size -= 1
+        while self.header.forward and self.header.forward[-1] is None:
+            self.header.forward.pop()
+        return True
+    
+    def load_from_file(self, filename):
+        # load list data from file (whitespace separated integers), kept in sorted order
+        try:
+            with open(filename, 'rb') as file:
+                self.load_stream(file)
+            return True
+        except Exception as e:
+            print(f"error loading file: {e}")
+            return False
+    
+    def load_stream(self, source, block_size=LinkedList.LOAD_BLOCK_SIZE, chunks=False):
+        # insert every integer of source, see LinkedList.load_stream
+        self.extend(itertools.chain.from_iterable(LinkedList.integer_batches(source, block_size, chunks)))
+    
+    def minimum(self):
+        # find minimum value in the list
+        return self.head.data if self.head else None
+    
+    def maximum(self):
+        # find maximum value in the list
+        return self.tail.data if self.tail else None
+    
+    def search(self, value):
+        # first node holding value, None if absent
+        node = self._path(value)[1].next
+        return node if node is not None and node.data == value else None
+    
+    def floor(self, value):
+        # largest value less than or equal to value
+        node = self._path(value, inclusive=True)[1]
+        return node.data if node is not self.header else None
+    
+    def ceiling(self, value):
+        # smallest value greater than or equal to value
+        node = self._path(value)[1].next
+        return node.data if node is not None else None
+    
+    def predecessor(self, value):
+        # largest value less than value, as in BinarySearchTree
+        node = self._path(value)[1]
+        return node.data if node is not self.header else None
+    
+    def successor(self, value):
+        # smallest value greater than value, as in BinarySearchTree
+        node = self._path(value, inclusive=True)[1].next
+        return node.data if node is not None else None
+    
+    def iter_range(self, low, high):
+        # values from low to high inclusive, in ascending order
+        node = self._path(low)[1].next
+        while node is not None and node.data <= high:
+            yield node.data
+            node = node.next
+    
+    def to_list(self):
+        # convert skip list to python list, in ascending order
+        result = []
+        current = self.head
+        while current:
+            result.append(current.data)
+            current = current.next
+        return result
+
+class BinarySearchTree:
+    # class implementing binary search tree functionality
+    
+    class Node:
+        # nested class for BST nodes
+        def __init__(self, data):
+            self.data = data
+            self.left = None
+            self.right = None
+    
+    def __init__(self):
+        # initialize empty BST
+        self.root = None
+        self.size = 0
+    
+    def insert(self, data):
+        # insert data into BST
+        self.root = self._insert_recursive(self.root, data)
+        self.size += 1
+    
+    def _insert_recursive(self, node, data):
+        # recursive helper for insertion
+        if node is None:
+            return self.Node(data)
+        
+        if data < node.data:
+            node.left = self._insert_recursive(node.left, data)
+        elif data > node.data:
+            node.right = self._insert_recursive(node.right, data)
+        # if data equals node.data, don't insert duplicate
+        
+        return node
+    
+    def delete(self, data):
+        # delete data from BST
+        self.root = self._delete_recursive(self.root, data)
+    
+    def _delete_recursive(self, node, data):
+        # recursive helper for deletion
+        if node is None:
+            return node
+        
+        if data < node.data:
+            node.left = self._delete_recursive(node.left, data)
+        elif data > node.data:
+            node.right = self._delete_recursive(node.right, data)
+        else:
+            # node to be deleted found
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            
+            # node with two children - get inorder successor
+            min_node = self._find_min_node(node.right)
+            node.data = min_node.data
+            node.right = self._delete_recursive(node.right, min_node.data)
+            
+        return node
+    
+    def search(self, data):
+        # search for data in BST
+        return self._search_recursive(self.root, data)
+    
+    def _search_recursive(self, node, data):
+        # recursive helper for search
+        if node is None or node.data == data:
+            return node
+        
+        if data < node.data:
+            return self._search_recursive(node.left, data)
+        else:
+            return self._search_recursive(node.right, data)
+    
+    def minimum(self):
+        # find minimum value in BST
+        if self.root is None:
+            return None
+        return self._find_min_node(self.root).data
+    
+    def _find_min_node(self, node):
+        # find node with minimum value
+        while node.left is not None:
+            node = node.left
+        return node
+    
+    def maximum(self):
+        # find maximum value in BST
+        if self.root is None:
+            return None
+        node = self.root
+        while node.right is not None:
+            node = node.right
+        return node.data
+    
+    def predecessor(self, data):
+        # find predecessor of given value
+        return self._predecessor_recursive(self.root, data, None)
+    
+    def _predecessor_recursive(self, node, data, predecessor):
+        # recursive helper for predecessor
+        if node is None:
+            return predecessor
+        
+        if data <= node.data:
+            return self._predecessor_recursive(node.left, data, predecessor)
+        else:
+            return self._predecessor_recursive(node.right, data, node.data)
+    
+    def successor(self, data):
+        # find successor of given value
+        return self._successor_recursive(self.root, data, None)
+    
+    def _successor_recursive(self, node, data, successor):
+        # recursive helper for successor
+        if node is None:
+            return successor
+        
+        if data >= node.data:
+            return self._successor_recursive(node.right, data, successor)
+        else:
+            return self._successor_recursive(node.left, data, node.data)
+    
+    def inorder_traversal(self):
+        # return inorder traversal of BST (sorted order)
+        result = []
+        self._inorder_recursive(self.root, result)
+        return result
+    
+    def _inorder_recursive(self, node, result):
+        # recursive helper for inorder traversal
+        if node is not None:
+            self._inorder_recursive(node.left, result)
+            result.append(node.data)
+            self._inorder_recursive(node.right, result)
+    
+    def preorder_traversal(self):
+        # return preorder traversal of BST
+        result = []
+        self._preorder_recursive(self.root, result)
+        return result
+    
+    def _preorder_recursive(self, node, result):
+        # recursive helper for preorder traversal
+        if node is not None:
+            result.append(node.data)
+            self._preorder_recursive(node.left, result)
+            self._preorder_recursive(node.right, result)
+    
+    def postorder_traversal(self):
+        # return postorder traversal of BST
+        result = []
+        self._postorder_recursive(self.root, result)
+        return result
+    
+    def _postorder_recursive(self, node, result):
+        # recursive helper for postorder traversal
+        if node is not None:
+            self._postorder_recursive(node.left, result)
+            self._postorder_recursive(node.right, result)
+            result.append(node.data)
+    
+    def load_from_file(self, filename):
+        # load BST data from file (one number per line)
+        try:
+            with open(filename, 'r') as file:
+                for line in file:
+                    self.insert(int(line.strip()))
+            return True
+        except Exception as e:
+            print(f"error loading file: {e}")
+            return False
+    
+    def visualize_tree(self):
+        # create a visual representation of the tree
+        if self.root is None:
+            return "Tree is empty"
+        
+        lines = []
+        self._visualize_recursive(self.root, lines, 0, "Root: ")
+        return "\n".join(lines)
+    
+    def _visualize_recursive(self, node, lines, depth, prefix):
+        # recursive helper for tree visualization
+        if node is not None:
+            lines.append("  " * depth + prefix + str(node.data))
+            if node.left is not None or node.right is not None:
+                if node.left is not None:
+                    self._visualize_recursive(node.left, lines, depth + 1, "L--- ")
+                else:
+                    lines.append("  " * (depth + 1) + "L--- None")
+                
+                if node.right is not None:
+                    self._visualize_recursive(node.right, lines, depth + 1, "R--- ")
+                else:
+                    lines.append("  " * (depth + 1) + "R--- None")
+
+class HashTable:
+    # Base class for hash table implementations
+    class Node:
+        def __init__(self, key, value):
+            self.key = key
+            self.value = value
+            self.next = None
+    
+    def __init__(self, size=101):
+        self.size = size
+        self.count = 0
+    
+    def hash_function1(self, key):
+        return hash(key) % self.size
+    
+    def hash_function2(self, key):
+        return 1 + (hash(key) % (self.size - 1))
+    
+    def insert(self, key, value):
+        raise NotImplementedError
+    
+    def search(self, key):
+        raise NotImplementedError
+    
+    def delete(self, key):
+        raise NotImplementedError
+    
+    def load_factor(self):
+        return self.count / self.size
+    
+    def resize(self, new_size):
+        raise NotImplementedError
+
+
+class ChainingHashTable(HashTable):
+    # Hash table with chaining collision resolution
+    def __init__(self, size=101):
+        super().__init__(size)
+        self.table = [None] * self.size
+    
+    def insert(self, key, value):
+        index = self.hash_function1(key)
+        if self.table[index] is None:
+            self.table[index] = self.Node(key, value)
+        else:
+            current = self.table[index]
+            while current.next is not None:
+                if current.key == key:
+                    current.value = value  # Update existing key
+                    return
+                current = current.next
+            if current.key == key:
+                current.value = value  # Update existing key
+            else:
+                current.next = self.Node(key, value)
+        self.count += 1
+    
+    def search(self, key):
+        index = self.hash_function1(key)
+        current = self.table[index]
+        while current is not None:
+            if current.key == key:
+                return current.value
+            current = current.next
+        return None
+    
+    def delete(self, key):
+        index = self.hash_function1(key)
+        current = self.table[index]
+        prev = None
+        while current is not None:
+            if current.key == key:
+                if prev is None:
+                    self.table[index] = current.next
+                else:
+                    prev.next = current.next
+                self.count -= 1
+                return True
+            prev = current
+            current = current.next
+        return False
+
+
+class LinearProbingHashTable(HashTable):
+    # Hash table with linear probing collision resolution
+    def __init__(self, size=101):
+        super().__init__(size)
+        self.table = [None] * self.size
+    
+    def insert(self, key, value):
+        if self.load_factor() > 0.7:
+            self.resize(self.size * 2)
+        
+        index = self.hash_function1(key)
+        while self.table[index] is not None and self.table[index].key != key:
+            index = (index + 1) % self.size
+        
+        if self.table[index] is None:
+            self.count += 1
+        self.table[index] = self.Node(key, value)
+    
+    def search(self, key):
+        index = self.hash_function1(key)
+        original_index = index
+        while self.table[index] is not None:
+            if self.table[index].key == key:
+                return self.table[index].value
+            index = (index + 1) % self.size
+            if index == original_index:
+                break
+        return None
+    
+    def delete(self, key):
+        index = self.hash_function1(key)
+        original_index = index
+        while self.table[index] is not None:
+            if self.table[index].key == key:
+                self.table[index] = None
+                self.count -= 1
+                self._rehash()
+                return True
+            index = (index + 1) % self.size
+            if index == original_index:
+                break
+        return False
+    
+    def _rehash(self):
+        old_table = self.table
+        self.table = [None] * self.size
+        self.count = 0
+        for node in old_table:
+            if node is not None:
+                self.insert(node.key, node.value)
+    
+    def resize(self, new_size):
+        old_table = self.table
+        self.size = new_size
+        self.table = [None] * self.size
+        self.count = 0
+        for node in old_table:
+            if node is not None:
+                self.insert(node.key, node.value)
+
+
+class DoubleHashingHashTable(HashTable):
+    # Hash table with double hashing collision resolution
+    def __init__(self, size=101):
+        super().__init__(size)
+        self.table = [None] * self.size
+    
+    def insert(self, key, value):
+        if self.load_factor() > 0.7:
+            self.resize(self.size * 2)
+        
+        index = self.hash_function1(key)
+        step = self.hash_function2(key)
+        attempts = 0
+        
+        while (self.table[index] is not None and 
+               self.table[index].key != key and 
+               attempts < self.size):
+            index = (index + step) % self.size
+            attempts += 1
+        
+        if attempts == self.size:
+            raise Exception("Hash table is full")
+        
+        if self.table[index] is None:
+            self.count += 1
+        self.table[index] = self.Node(key, value)
+    
+    def search(self, key):
+        index = self.hash_function1(key)
+        step = self.hash_function2(key)
+        original_index = index
+        attempts = 0
+        
+        while (self.table[index] is not None and 
+               attempts < self.size):
+            if self.table[index].key == key:
+                return self.table[index].value
+            index = (index + step) % self.size
+            attempts += 1
+            if index == original_index:
+                break
+        return None
+    
+    def delete(self, key):
+        index = self.hash_function1(key)
+        step = self.hash_function2(key)
+        original_index = index
+        attempts = 0
+        
+        while (self.table[index] is not None and 
+               attempts < self.size):
+            if self.table[index].key == key:
+                self.table[index] = None
+                self.count -= 1
+                self._rehash()
+                return True
+            index = (index + step) % self.size
+            attempts += 1
+            if index == original_index:
+                break
+        return False
+    
+    def _rehash(self):
+        old_table = self.table
+        self.table = [None] * self.size
+        self.count = 0
+        for node in old_table:
+            if node is not None:
+                self.insert(node.key, node.value)
+    
+    def resize(self, new_size):
+        old_table = self.table
+        self.size = new_size
+        self.table = [None] * self.size
+        self.count = 0
+        for node in old_table:
+            if node is not None:
+                self.insert(node.key, node.value)
@@ -0,0 +1,882 @@
+# benchmark runners for the algorithm platform, usable from the GUI or headless:
+#     python -m benchmarks bench sort|hash|structures --sizes 10,100,1000 --runs 5 --json out.json --png out.png
+# nothing here imports tkinter, matplotlib is only imported when a chart is rendered
+import argparse
+import copy
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+import history
+from timing import DEFAULT_WARMUP, time_operation, summarize, format_stats, fit_power_law
+from memory import trace_operation, deep_sizeof, format_memory
+from workloads import DISTRIBUTIONS, generate, uniform
+from datasets import DatasetCache, DEFAULT_CACHE_DIR, DEFAULT_CACHE_SEED, DEFAULT_MAX_BYTES
+from algorithms import (exit_with_parent, SortingAlgorithms, SORT_ALGORITHMS, SELECTION_ALGORITHMS, SortCounter,
+                        LinkedList, UnrolledLinkedList, SkipList, BinarySearchTree, ChainingHashTable, LinearProbingHashTable,
+                        DoubleHashingHashTable)
+
+HASH_TABLE_TYPES = {
+    "Chaining": ChainingHashTable,
+    "Linear Probing": LinearProbingHashTable,
+    "Double Hashing": DoubleHashingHashTable,
+}
+# the sort benchmark can also time LinkedList.sort on a linked list holding the same input
+LINKED_LIST_SORT = "Linked List Sort (in place)"
+SORT_BENCHMARK_ALGORITHMS = list(SORT_ALGORITHMS) + [LINKED_LIST_SORT]
+STRUCTURES = ["Array", "Linked List", "Unrolled Linked List", "Skip List", "BST"]
+STRUCTURE_OPERATIONS = ["Insertion", "Deletion", "Search"]
+COMPARISONS_PANEL = "comparison counts"
+MEMORY_PANEL = "peak memory"
+FOOTPRINT_PANEL = "footprint per element"
+# lists per batch in the batch sorting benchmark
+BATCH_LISTS = 10000
+BATCH_SERIES = {
+    "sort_many": SortingAlgorithms.sort_many,
+    "sort_many (no numpy)": lambda lists: SortingAlgorithms.sort_many(lists, use_numpy=False),
+    "per-list Quick Sort": lambda lists: [SortingAlgorithms.quick_sort(arr) for arr in lists],
+    "per-list Merge Sort": lambda lists: [SortingAlgorithms.merge_sort(arr) for arr in lists],
+    "per-list Insertion Sort": lambda lists: [SortingAlgorithms.insertion_sort(arr) for arr in lists],
+}
+# charts per row when a result document has several panels
+PLOT_COLUMNS = 3
+# growth rates are fitted on the largest this many measured sizes of a series
+FIT_POINTS = 3
+# seconds between the cancel checks while waiting for a cell running in a worker process
+CANCEL_POLL_SECONDS = 0.2
+
+
+class BenchmarkCancelled(Exception):
+    # raised by a runner between two cells once its cancel event is set
+    pass
+
+
+def check_cancelled(cancel):
+    # raise BenchmarkCancelled when cancel, a multiprocessing.Event or None, is set
+    if cancel is not None and cancel.is_set():
+        raise BenchmarkCancelled("benchmark cancelled")
+
+
+def cell_result(future, cancel):
+    # result of a cell running in a worker process, checking cancel while waiting for it
+    while True:
+        try:
+            return future.result(timeout=CANCEL_POLL_SECONDS)
+        except FutureTimeoutError:
+            check_cancelled(cancel)
+
+
+def new_results(benchmark, sizes, runs):
+    # empty result document, one panel per chart
+    return {"benchmark": benchmark, "sizes": list(sizes), "runs": runs, "panels": []}
+
+
+def add_panel(results, title, ylabel, labels, xlabel="input size", log_y=True, scale=1.0):
+    # add a chart panel with an empty value list per series and return it;
+    # timed panels also keep the summary statistics behind each plotted median
+    panel = {"title": title, "xlabel": xlabel, "ylabel": ylabel, "log_y": log_y, "scale": scale,
+             "series": {label: [] for label in labels}, "stats": {label: [] for label in labels}}
+    results["panels"].append(panel)
+    return panel
+
+
+def record(panel, label, times, number):
+    # summarize the per-call times of one cell into panel, returns the summary
+    stats = summarize(times, number)
+    panel["stats"][label].append(stats)
+    panel["series"][label].append(stats["median"] * panel["scale"])
+    return stats
+
+
+def record_extrapolated(panel, label, value):
+    # record a skipped cell with its predicted per-call time standing in for every statistic
+    stats = {"median": value, "p95": value, "mean": value, "stdev": 0.0, "ci_low": value, "ci_high": value,
+             "mean_ci_low": value, "mean_ci_high": value, "runs": 0, "number": 0, "extrapolated": True}
+    panel["stats"][label].append(stats)
+    panel["series"][label].append(value * panel["scale"])
+    return stats
+
+
+def growth_fit(sizes, stats):
+    # (exponent, coefficient) of the measured cells of one series, see fit_power_law
+    measured = [(size, cell["median"]) for size, cell in zip(sizes, stats) if not cell.get("extrapolated")]
+    measured = sorted(measured)[-FIT_POINTS:]
+    return fit_power_law([size for size, _ in measured], [median for _, median in measured])
+
+
+def cell_counter(results, total, cell_done=None):
+    # callable to call after every finished cell, reports cell_done(results, done, total) when given
+    done = 0
+
+    def finished():
+        nonlocal done
+        done += 1
+        if cell_done is not None:
+            cell_done(results, done, total)
+    return finished
+
+
+def linked_list_of(values):
+    # linked list holding values in order
+    linked_list = LinkedList()
+    linked_list.extend(values)
+    return linked_list
+
+
+def sort_series(algorithms, workers=(1,), k=100, selections=(), buffers=False):
+    # label -> sort function for every benchmarked variant,
+    # parallel merge sort gets one series per worker count; with buffers the sorts take an
+    # array('q') and run through SortingAlgorithms.sort_buffer instead of taking a list
+    series = {}
+    for algo in algorithms:
+        if algo == "Parallel Merge Sort":
+            for w in workers:
+                series[f"{algo} ({w} workers)"] = (
+                    (lambda buf, w=w: SortingAlgorithms.sort_buffer(buf, "Parallel Merge Sort", workers=w))
+                    if buffers else (lambda arr, w=w: SortingAlgorithms.parallel_merge_sort(arr, workers=w)))
+        elif algo == LINKED_LIST_SORT:
+            # round trip through a linked list, for the untimed count and memory runs;
+            # the timed runs get prebuilt linked lists, see measure_sort_cell
+            series[algo] = lambda arr: linked_list_of(arr).sort().to_list()
+        elif buffers:
+            series[algo] = lambda buf, algo=algo: SortingAlgorithms.sort_buffer(buf, algo)
+        else:
+            series[algo] = SORT_ALGORITHMS[algo]
+    for op in selections:
+        # k is clamped so the small sizes still run
+        series[f"{op} (k={k})"] = (
+            lambda arr, func=SELECTION_ALGORITHMS[op]: func(arr, min(k, len(arr) - 1)))
+    return series
+
+
+def measure_sort_cell(label, algorithms, workers, k, selections, dist, size, seed, runs,
+                      warmup=DEFAULT_WARMUP, count_ops=False, measure_memory=False, datasets=None,
+                      buffers=False):
+    # time one series on one (distribution, size) cell, plus the optional untimed count and
+    # memory runs; takes and returns plain data only, so cells can run in worker processes.
+    # inputs come from the datasets cache when one is given, else they are generated
+    sort_func = sort_series(algorithms, workers, k, selections)[label]
+    load = datasets.get if datasets is not None else generate
+    # linked lists are built from the input outside the timed region, only the relinking is timed;
+    # with buffers every timed call sorts its own array('q') copy in place through sort_buffer,
+    # the count run still instruments the list engines
+    if label == LINKED_LIST_SORT:
+        prepare, timed_func = linked_list_of, LinkedList.sort
+    elif buffers:
+        prepare, timed_func = (lambda data: array('q', data)), sort_series(
+            algorithms, workers, k, selections, buffers=True)[label]
+    else:
+        prepare, timed_func = list.copy, sort_func
+    # `runs` consecutive samples cycle once through the same seeded inputs for every
+    # algorithm; each call sorts its own copy, made outside the timed region
+    sample_index = iter(range(1 << 62))
+
+    def setup(number):
+        test_data = load(dist, size, seed, next(sample_index) % runs)
+        return [prepare(test_data) for _ in range(number)]
+    run_times, number = time_operation(lambda copies: timed_func(copies.pop()), setup,
+                                       runs=runs, warmup=warmup)
+    cell = {"times": run_times, "number": number, "counts": None, "memory": None}
+    if count_ops:
+        # one extra untimed run with instrumentation on
+        counter = SortCounter()
+        counter.run(sort_func, load(dist, size, seed))
+        cell["counts"] = counter.as_dict()
+        cell["summary"] = counter.summary()
+    if measure_memory:
+        # one extra untimed run under tracemalloc, on an input prepared like the timed ones
+        cell["memory"] = trace_operation(timed_func, prepare(load(dist, size, seed)))
+    return cell
+
+
+def _init_cell_worker(stop, counter=None, cpus=None):
+    # process pool initializer: exit together with the benchmark process or once stop is set,
+    # see exit_with_parent, and pin each new worker to the next cpu of the list when cpus are given
+    exit_with_parent(stop)
+    if cpus is not None:
+        with counter.get_lock():
+            cpu = cpus[counter.value % len(cpus)]
+            counter.value += 1
+        os.sched_setaffinity(0, {cpu})
+
+
+def cell_executors(labels, jobs=1, isolate=False, pin_cpus=False, stop=None):
+    # label -> executor that runs the cells of that series, None to run them in this process;
+    # isolate gives every series a single worker process of its own, so heap growth of one
+    # algorithm cannot affect the timings of another. the workers end themselves once stop, a
+    # multiprocessing.RawValue, is set or this process dies, so no cell outlives the benchmark
+    if jobs <= 1 and not isolate:
+        return {label: None for label in labels}
+    options = {"initializer": _init_cell_worker, "initargs": (stop,)}
+    if pin_cpus:
+        if not hasattr(os, "sched_setaffinity"):
+            raise ValueError("cpu pinning needs os.sched_setaffinity, which this platform lacks")
+        options["initargs"] = (stop, multiprocessing.Value('i', 0), sorted(os.sched_getaffinity(0)))
+    if isolate:
+        return {label: ProcessPoolExecutor(max_workers=1, **options) for label in labels}
+    pool = ProcessPoolExecutor(max_workers=jobs, **options)
+    return {label: pool for label in labels}
+
+
+def run_sort_benchmark(sizes, runs, algorithms, workers=(1,), k=100, selections=(),
+                       count_ops=False, plot_counts=False, warmup=DEFAULT_WARMUP,
+                       distributions=("uniform",), seed=None, measure_memory=False, budget=None,
+                       jobs=1, isolate=False, pin_cpus=False, datasets=None, buffers=False, progress=print,
+                       cell_done=None, cancel=None):
+    # time every selected sorting and selection algorithm at every input size and distribution;
+    # all algorithms sort the same seeded inputs; when no seed is given it is DEFAULT_CACHE_SEED
+    # with datasets and drawn otherwise, and recorded either way.
+    # with a budget in seconds per cell, sizes run in ascending order and a cell whose runtime,
+    # predicted from the growth rate fitted on the sizes done so far, exceeds the budget is
+    # skipped and recorded as extrapolated, along with all larger sizes of that series.
+    # with jobs > 1 the cells of one size run concurrently in a process pool (isolate: one
+    # process per series, at most jobs of them busy), results are still recorded in order.
+    # datasets, a DatasetCache, keeps the generated inputs on disk across runs and processes;
+    # buffers times the sorts on array('q') buffers through sort_buffer rather than on lists.
+    # setting cancel, a multiprocessing.Event, stops the run between cells with BenchmarkCancelled
+    series = sort_series(algorithms, workers, k, selections)
+    labels = list(series)
+    if budget is not None:
+        sizes = sorted(sizes)
+    results = new_results("sort", sizes, runs)
+    results["budget"] = budget
+    if seed is None:
+        seed = DEFAULT_CACHE_SEED if datasets is not None else random.randrange(2 ** 32)
+    results["seed"] = seed
+    results["distributions"] = list(distributions)
+    results["execution"] = {"jobs": jobs, "isolate": isolate, "pin_cpus": pin_cpus, "buffers": buffers}
+    count_ops = count_ops or plot_counts
+    if count_ops:
+        results["counts"] = {dist: {label: [] for label in series} for dist in distributions}
+    if measure_memory:
+        results["memory"] = {dist: {label: [] for label in series} for dist in distributions}
+    times, comparisons, memory = {}, {}, {}
+    for dist in distributions:
+        suffix = f" ({dist})" if len(distributions) > 1 else ""
+        times[dist] = add_panel(results, "sorting algorithm performance" + suffix,
+                                "median time (seconds)", series)
+        if plot_counts:
+            comparisons[dist] = add_panel(results, COMPARISONS_PANEL + suffix, "comparisons", series)
+        if measure_memory:
+            memory[dist] = add_panel(results, MEMORY_PANEL + suffix, "peak traced memory (bytes)", series)
+
+    finished = cell_counter(results, len(sizes) * len(distributions) * len(series), cell_done)
+    # calibration, warmup and timed runs; the count and memory runs are slower still
+    calls_per_cell = runs + warmup + 1 + count_ops + measure_memory
+    skipped = set()
+
+    stop = multiprocessing.RawValue('b', 0)
+    executors = cell_executors(labels, jobs, isolate, pin_cpus, stop)
+    mode = f", {jobs} worker processes" if jobs > 1 and not isolate else ""
+    if isolate:
+        mode = f", one process per series, {max(jobs, 1)} at a time"
+    if buffers:
+        mode += ", array('q') buffers"
+    progress(f"running performance tests (seed {seed}{mode}{', pinned to cpus' if pin_cpus else ''})...")
+    try:
+        for size in sizes:
+            # every cell of this size, with the predicted time of the ones over budget
+            wave = []
+            for dist in distributions:
+                for label in labels:
+                    predicted = None
+                    if budget is not None:
+                        done = [cell for cell in times[dist]["stats"][label] if not cell.get("extrapolated")]
+                        fit = growth_fit(sizes, done)
+                        if fit is None and done:
+                            # a single measured size, assume linear growth, the least any of them can do
+                            fit = 1.0, done[-1]["median"] / sizes[len(done) - 1]
+                        estimate = fit[1] * size ** fit[0] if fit else 0.0
+                        if (dist, label) in skipped or estimate * calls_per_cell > budget:
+                            skipped.add((dist, label))
+                            predicted = estimate
+                    wave.append((dist, label, predicted))
+
+            # a pool gets the whole wave at once, isolated series are kept to jobs busy processes
+            window = max(jobs, 1) if isolate else len(wave)
+            futures = {}
+            for i, (dist, label, predicted) in enumerate(wave):
+                check_cancelled(cancel)
+                for j in range(i, min(i + window, len(wave))):
+                    ahead_dist, ahead_label, ahead_predicted = wave[j]
+                    if j not in futures and ahead_predicted is None and executors[ahead_label] is not None:
+                        futures[j] = executors[ahead_label].submit(
+                            measure_sort_cell, ahead_label, algorithms, workers, k, selections, ahead_dist,
+                            size, seed, runs, warmup, count_ops, measure_memory, datasets, buffers)
+
+                if label == labels[0]:
+                    progress(f"\ntesting size {size}, {dist} input:" if len(distributions) > 1
+                             else f"\ntesting size {size}:")
+                if predicted is not None:
+                    record_extrapolated(times[dist], label, predicted)
+                    progress(f"{label}: skipped, predicted {predicted:.6f} sec per call "
+                             f"exceeds the {budget:g} sec budget")
+                else:
+                    if i in futures:
+                        cell = cell_result(futures.pop(i), cancel)
+                    else:
+                        cell = measure_sort_cell(label, algorithms, workers, k, selections, dist, size, seed,
+                                                 runs, warmup, count_ops, measure_memory, datasets, buffers)
+                    stats = record(times[dist], label, cell["times"], cell["number"])
+                    line = f"{label}: {format_stats(stats)}"
+                    if count_ops:
+                        results["counts"][dist][label].append(cell["counts"])
+                        if plot_counts:
+                            comparisons[dist]["series"][label].append(cell["counts"]["comparisons"])
+                        line += f" | {cell['summary']}"
+                    if measure_memory:
+                        results["memory"][dist][label].append(cell["memory"])
+                        memory[dist]["series"][label].append(cell["memory"]["peak"])
+                        line += f" | {format_memory(cell['memory'])}"
+                    progress(line)
+                finished()
+
+                if label == labels[-1] and "Parallel Merge Sort" in algorithms and len(workers) > 1:
+                    medians = times[dist]["series"]
+                    base = medians[f"Parallel Merge Sort ({workers[0]} workers)"][-1]
+                    speedups = ", ".join(
+                        f"{w}: {base / medians[f'Parallel Merge Sort ({w} workers)'][-1]:.2f}x"
+                        for w in workers[1:])
+                    progress(f"speedup vs {workers[0]} workers: {speedups}")
+    except BaseException:
+        # cancelled or failed: the cells still running in worker processes stop as well
+        stop.value = 1
+        raise
+    finally:
+        for executor in set(executors.values()) - {None}:
+            executor.shutdown(cancel_futures=True)
+
+    progress("\nfitted growth rates:")
+    for dist in distributions:
+        panel = times[dist]
+        panel["fits"] = {}
+        for label in series:
+            fit = growth_fit(sizes, panel["stats"][label])
+            if fit is not None:
+                panel["fits"][label] = fit[0]
+                progress(f"{label}{f' ({dist})' if len(distributions) > 1 else ''}: ~ n^{fit[0]:.2f}")
+    return results
+
+
+def run_batch_benchmark(sizes, runs, lists=BATCH_LISTS, warmup=DEFAULT_WARMUP, seed=None, progress=print,
+                        cell_done=None, cancel=None):
+    # time sort_many against one engine call per list on batches of lists, sizes are list lengths
+    results = new_results("batch", sizes, runs)
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    results["seed"] = seed
+    results["lists"] = lists
+    panel = add_panel(results, f"batch sorting ({lists} lists)", "median time per batch (seconds)",
+                      BATCH_SERIES, xlabel="list length")
+    finished = cell_counter(results, len(sizes) * len(BATCH_SERIES), cell_done)
+
+    progress(f"running batch sorting tests (seed {seed}, {lists} lists per batch)...")
+    for size in sizes:
+        progress(f"\ntesting list length {size}:")
+        rng = random.Random(f"{seed}:batch:{size}")
+        batch = [uniform(size, rng) for _ in range(lists)]
+
+        def setup(number):
+            return [[arr.copy() for arr in batch] for _ in range(number)]
+        for label, sort_func in BATCH_SERIES.items():
+            check_cancelled(cancel)
+            run_times, number = time_operation(lambda copies: sort_func(copies.pop()), setup,
+                                               runs=runs, warmup=warmup)
+            stats = record(panel, label, run_times, number)
+            progress(f"{label}: {format_stats(stats)}")
+            finished()
+
+        speedup = panel["series"]["per-list Quick Sort"][-1] / panel["series"]["sort_many"][-1]
+        progress(f"sort_many speedup vs per-list Quick Sort: {speedup:.2f}x")
+    return results
+
+
+def run_hash_benchmark(sizes, runs, warmup=DEFAULT_WARMUP, progress=print, cell_done=None, cancel=None):
+    # time successful and unsuccessful searches in each hash table implementation
+    results = new_results("hash", sizes, runs)
+    successful = add_panel(results, "Successful Searches", "median time per search pass (seconds)",
+                           HASH_TABLE_TYPES)
+    unsuccessful = add_panel(results, "Unsuccessful Searches", "median time per search pass (seconds)",
+                             HASH_TABLE_TYPES)
+    finished = cell_counter(results, len(sizes) * len(HASH_TABLE_TYPES), cell_done)
+
+    progress("running performance tests...")
+    for size in sizes:
+        progress(f"\ntesting size {size}:")
+
+        # Generate test data
+        test_data = [str(random.randint(1, size*10)) for _ in range(size)]
+        search_data = test_data[:100]  # Limit to 100 searches per run
+        not_present_data = [str(random.randint(size*10 + 1, size*20)) for _ in range(min(size, 100))]
+
+        for ht_type, table_class in HASH_TABLE_TYPES.items():
+            check_cancelled(cancel)
+            ht = table_class(size*2)  # Larger size to keep load factor reasonable
+
+            # Insert all test data
+            for key in test_data:
+                ht.insert(key, f"value_{key}")
+
+            def search_all(keys):
+                for key in keys:
+                    ht.search(key)
+
+            run_times, number = time_operation(search_all, lambda number: search_data, runs=runs, warmup=warmup)
+            successful_stats = record(successful, ht_type, run_times, number)
+            run_times, number = time_operation(search_all, lambda number: not_present_data,
+                                               runs=runs, warmup=warmup)
+            unsuccessful_stats = record(unsuccessful, ht_type, run_times, number)
+
+            progress(f"{ht_type}: successful {format_stats(successful_stats)}")
+            progress(f"{ht_type}: unsuccessful {format_stats(unsuccessful_stats)}")
+            finished()
+    return results
+
+
+def structure_operations(size):
+    # struct -> op -> (setup, op, max_number) at the given size; setup(number) builds a fresh
+    # structure (plus a target for searches and deletions), max_number caps the calibrated
+    # loop count of operations that use the structure up
+    def build_array(number):
+        return [random.randint(1, size*10) for _ in range(size)]
+
+    def build_linked_list(number):
+        ll = LinkedList()
+        for num in build_array(number):
+            ll.insert_at_head(num)
+        return ll
+
+    def build_unrolled_list(number):
+        ul = UnrolledLinkedList()
+        for num in build_array(number):
+            ul.insert_at_head(num)
+        return ul
+
+    def build_skip_list(number):
+        sl = SkipList()
+        sl.extend(build_array(number))
+        return sl
+
+    def build_bst(number):
+        # distinct values, so every one of them can be deleted
+        bst = BinarySearchTree()
+        for num in random.sample(range(1, size*10 + 1), size):
+            bst.insert(num)
+        return bst
+
+    def with_target(build, contents):
+        def setup(number):
+            structure = build(number)
+            return structure, random.choice(contents(structure))
+        return setup
+
+    def with_deletion_order(build, contents):
+        def setup(number):
+            structure = build(number)
+            targets = contents(structure)
+            random.shuffle(targets)
+            return structure, iter(targets)
+        return setup
+
+    def with_fresh_values(build, contents):
+        # structure plus number distinct values not in it yet, in random order, so every timed
+        # insert really inserts; size + number distinct candidates out of 20 * size hold at
+        # least number fresh ones while number stays within size
+        def setup(number):
+            structure = build(number)
+            present = set(contents(structure))
+            candidates = random.sample(range(1, size*20 + 1), size + number)
+            return structure, iter([value for value in candidates if value not in present][:number])
+        return setup
+
+    def remove_head(ll):
+        if ll.head:
+            ll.head = ll.head.next
+            ll.size -= 1
+            if ll.head is None:
+                ll.tail = None
+
+    value = random.randint(1, size*10)
+    return {
+        "Array": {
+            "Insertion": (build_array, lambda arr: arr.append(value), None),
+            "Deletion": (build_array, lambda arr: arr.pop(), size),
+            "Search": (with_target(build_array, list), lambda state: state[1] in state[0], None),
+        },
+        "Linked List": {
+            "Insertion": (build_linked_list, lambda ll: ll.insert_at_head(value), None),
+            "Deletion": (build_linked_list, remove_head, size),
+            "Search": (with_target(build_linked_list, LinkedList.to_list),
+                       lambda state: state[0].search(state[1]), None),
+        },
+        "Unrolled Linked List": {
+            "Insertion": (build_unrolled_list, lambda ul: ul.insert_at_head(value), None),
+            "Deletion": (build_unrolled_list, UnrolledLinkedList.delete_at_head, size),
+            "Search": (with_target(build_unrolled_list, UnrolledLinkedList.to_list),
+                       lambda state: state[0].search(state[1]), None),
+        },
+        "Skip List": {
+            "Insertion": (build_skip_list, lambda sl: sl.insert(value), None),
+            "Deletion": (with_deletion_order(build_skip_list, SkipList.to_list),
+                         lambda state: state[0].delete(next(state[1])), size),
+            "Search": (with_target(build_skip_list, SkipList.to_list),
+                       lambda state: state[0].search(state[1]), None),
+        },
+        "BST": {
+            "Insertion": (with_fresh_values(build_bst, BinarySearchTree.inorder_traversal),
+                          lambda state: state[0].insert(next(state[1])), size),
+            "Deletion": (with_deletion_order(build_bst, BinarySearchTree.inorder_traversal),
+                         lambda state: state[0].delete(next(state[1])), size),
+            "Search": (with_target(build_bst, BinarySearchTree.inorder_traversal),
+                       lambda state: state[0].search(state[1]), None),
+        },
+    }
+
+
+def footprint_structures(size):
+    # every structure holding the same size distinct integers, for the deep per-element footprint;
+    # hash tables get a prime capacity of about twice the size, which double hashing needs to
+    # reach every slot, and store each key as its own value
+    keys = random.sample(range(1, size*10 + 1), size)
+    capacity = next(n for n in itertools.count(size*2 + 1)
+                    if all(n % d for d in range(2, int(n ** 0.5) + 1)))
+    linked_list = LinkedList()
+    unrolled_list = UnrolledLinkedList()
+    skip_list = SkipList()
+    bst = BinarySearchTree()
+    for key in keys:
+        linked_list.insert_at_head(key)
+        unrolled_list.insert_at_head(key)
+        skip_list.insert(key)
+        bst.insert(key)
+    structures = {"Array": keys, "Linked List": linked_list, "Unrolled Linked List": unrolled_list,
+                  "Skip List": skip_list, "BST": bst}
+    for name, table_class in HASH_TABLE_TYPES.items():
+        table = table_class(capacity)
+        for key in keys:
+            table.insert(key, key)
+        structures[f"{name} Hash Table"] = table
+    return structures
+
+
+def run_structure_benchmark(sizes, runs, warmup=DEFAULT_WARMUP, measure_memory=False, progress=print,
+                            cell_done=None, cancel=None):
+    # time single insertions, deletions and searches in an array, a linked list and a BST;
+    # the memory mode adds the peak memory of each operation and the deep footprint per element
+    # of every structure, hash tables included
+    results = new_results("structures", sizes, runs)
+    panels = {op: add_panel(results, f"{op} Performance", "Median time per operation (us)", STRUCTURES,
+                            xlabel="Input Size", log_y=False, scale=1e6)
+              for op in STRUCTURE_OPERATIONS}
+    if measure_memory:
+        results["memory"] = {f"{struct} {op}": [] for struct in STRUCTURES for op in STRUCTURE_OPERATIONS}
+        peaks = add_panel(results, MEMORY_PANEL, "peak traced memory (bytes)", results["memory"],
+                          xlabel="Input Size", log_y=False)
+        footprints = add_panel(results, FOOTPRINT_PANEL, "deep size per element (bytes)",
+                               footprint_structures(1), xlabel="Input Size", log_y=False)
+    finished = cell_counter(results, len(sizes) * len(STRUCTURES) * len(STRUCTURE_OPERATIONS), cell_done)
+
+    progress("Running performance tests...")
+    for size in sizes:
+        progress(f"\nTesting size {size}:")
+        operations = structure_operations(size)
+        for struct in STRUCTURES:
+            for op in STRUCTURE_OPERATIONS:
+                check_cancelled(cancel)
+                setup, func, max_number = operations[struct][op]
+                run_times, number = time_operation(func, setup, runs=runs, warmup=warmup,
+                                                   max_number=max_number)
+                stats = record(panels[op], struct, run_times, number)
+                line = f"{struct} {op}: {format_stats(stats, scale=1e6, unit='us', digits=3)}"
+                if measure_memory:
+                    # one extra untimed operation under tracemalloc, on a fresh structure
+                    stats = trace_operation(func, setup(1))
+                    results["memory"][f"{struct} {op}"].append(stats)
+                    peaks["series"][f"{struct} {op}"].append(stats["peak"])
+                    line += f" | {format_memory(stats)}"
+                progress(line)
+                finished()
+        if measure_memory:
+            for name, structure in footprint_structures(size).items():
+                per_element = deep_sizeof(structure) / size
+                footprints["series"][name].append(per_element)
+                progress(f"{name} footprint: {per_element:.1f} bytes per element")
+    return results
+
+
+RUNNERS = {
+    "sort": run_sort_benchmark,
+    "hash": run_hash_benchmark,
+    "structures": run_structure_benchmark,
+    "batch": run_batch_benchmark,
+}
+
+
+def run_in_worker(suite, kwargs, messages, cancel=None):
+    # entry point of a background benchmark process: runs one suite and reports through the
+    # messages queue ("line", text), ("cell", results so far, done, total), then ("done", results),
+    # ("cancelled",) once the cancel event was set, or ("error", text). the process leads a
+    # process group of its own, so the GUI can kill it together with its pool workers when
+    # it does not stop on the cancel event; as that group no longer gets the terminal's Ctrl-C,
+    # the process also ends itself once the GUI is gone, see exit_with_parent
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    exit_with_parent()
+
+    def progress(line):
+        messages.put(("line", line))
+
+    def cell_done(results, done, total):
+        messages.put(("cell", copy.deepcopy(results), done, total))
+    try:
+        results = RUNNERS[suite](progress=progress, cell_done=cell_done, cancel=cancel, **kwargs)
+    except BenchmarkCancelled:
+        messages.put(("cancelled",))
+    except Exception as error:
+        messages.put(("error", f"{type(error).__name__}: {error}"))
+    else:
+        messages.put(("done", results))
+
+
+def plot_results(figure, results, baseline=None, regressions=()):
+    # draw every panel of a result document side by side on a matplotlib figure; a baseline
+    # document is overlaid dashed in the same colours and regressed cells are marked with a red x
+    sizes = results["sizes"]
+    baseline_panels = {panel["title"]: panel for panel in baseline["panels"]} if baseline else {}
+    panels = results["panels"]
+    log_x = min(sizes) > 0 and max(sizes) / min(sizes) > 100
+    columns = min(len(panels), PLOT_COLUMNS)
+    rows = -(-len(panels) // columns)
+    for i, panel in enumerate(panels):
+        ax = figure.add_subplot(rows, columns, i + 1)
+        extrapolated = False
+        for name, values in panel["series"].items():
+            stats = panel["stats"][name]
+            label = name
+            if name in panel.get("fits", {}):
+                label = f"{name} (\u2248 n^{panel['fits'][name]:.2f})"
+            if stats:
+                # error bars span the 95% confidence interval of each median
+                scale = panel["scale"]
+                line = ax.errorbar(sizes[:len(values)], values, label=label, marker='o', capsize=3,
+                                   yerr=[[value - s["ci_low"] * scale for value, s in zip(values, stats)],
+                                         [s["ci_high"] * scale - value for value, s in zip(values, stats)]]).lines[0]
+            else:
+                line, = ax.plot(sizes[:len(values)], values, label=label, marker='o')
+            # extrapolated cells get hollow markers
+            skipped = [(size, value) for size, value, cell in zip(sizes, values, stats) if cell.get("extrapolated")]
+            if skipped:
+                ax.plot(*zip(*skipped), linestyle='none', marker='o', markersize=9, markerfacecolor='white',
+                        color=line.get_color())
+                extrapolated = True
+            # the baseline is looked up by series name, the label may carry the fitted exponent
+            base_values = baseline_panels.get(panel["title"], {"series": {}})["series"].get(name)
+            if base_values:
+                ax.plot(baseline["sizes"][:len(base_values)], base_values, linestyle='--', marker='.',
+                        color=line.get_color(), alpha=0.6, label=f"{name} (baseline)")
+        marks = [cell for cell in regressions if cell["panel"] == panel["title"]]
+        if marks:
+            ax.plot([cell["size"] for cell in marks], [cell["current"] for cell in marks], 'rx',
+                    markersize=12, markeredgewidth=2, label="regressed")
+        if panel["title"].startswith(COMPARISONS_PANEL):
+            ax.plot(sizes, [n * max(n, 2).bit_length() for n in sizes], 'k--', label='n log n')
+            ax.plot(sizes, [n * n for n in sizes], 'k:', label='n\u00b2')
+        if extrapolated:
+            ax.plot([], [], linestyle='none', marker='o', markerfacecolor='white', color='gray',
+                    label="extrapolated (over budget)")
+        ax.set_xlabel(panel["xlabel"])
+        ax.set_ylabel(panel["ylabel"])
+        ax.set_title(panel["title"])
+        ax.legend()
+        ax.grid(True)
+        if log_x or panel["title"].startswith(COMPARISONS_PANEL):
+            ax.set_xscale('log')
+            if panel["log_y"]:
+                ax.set_yscale('log')
+    if len(panels) > 1:
+        figure.tight_layout()
+
+
+def save_png(results, path, baseline=None, regressions=()):
+    # render the charts of a result document to a PNG file without any GUI backend
+    from matplotlib.figure import Figure
+    panels = len(results["panels"])
+    figure = Figure(figsize=(6 * min(panels, PLOT_COLUMNS), 4 * -(-panels // PLOT_COLUMNS)), dpi=100)
+    plot_results(figure, results, baseline, regressions)
+    figure.savefig(path)
+
+
+def save_json(results, path):
+    # write a result document as JSON
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def save_csv(results, path):
+    # write a result document as CSV, one row per panel, series and size;
+    # the statistics columns are in seconds and empty for untimed panels
+    stat_columns = ["median", "p95", "mean", "stdev", "ci_low", "ci_high", "runs", "number", "extrapolated"]
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["benchmark", "panel", "series", "size", "value"] + stat_columns)
+        for panel in results["panels"]:
+            for label, values in panel["series"].items():
+                stats = panel["stats"][label] or [{}] * len(values)
+                for size, value, cell in zip(results["sizes"], values, stats):
+                    writer.writerow([results["benchmark"], panel["title"], label, size, value]
+                                    + [cell.get(column, "") for column in stat_columns])
+
+
+def _int_list(text):
+    # argparse type for comma separated integers
+    try:
+        return [int(part) for part in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated integers, got {text!r}")
+
+
+def _name_list(choices):
+    # argparse type for comma separated names out of choices
+    def parse(text):
+        names = [part.strip() for part in text.split(",") if part.strip()]
+        unknown = [name for name in names if name not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown name(s) {unknown}, choose from {list(choices)}")
+        return names
+    return parse
+
+
+def _run_id(text):
+    # argparse type for a stored run id or 'latest'
+    if text != "latest" and not text.isdigit():
+        raise argparse.ArgumentTypeError(f"expected a run id or 'latest', got {text!r}")
+    return text
+
+
+def build_parser():
+    # command line interface of the headless runner
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="headless benchmark runner for the algorithm platform")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bench = commands.add_parser("bench", help="run a benchmark suite")
+    bench.add_argument("suite", choices=list(RUNNERS))
+    bench.add_argument("--sizes", type=_int_list, default=[10, 100, 1000, 10000],
+                       help="comma separated input sizes")
+    bench.add_argument("--runs", type=int, default=10, help="timed samples per cell")
+    bench.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="untimed warmup samples per cell")
+    bench.add_argument("--algorithms", type=_name_list(SORT_BENCHMARK_ALGORITHMS), default=SORT_BENCHMARK_ALGORITHMS,
+                       help="sort suite: comma separated algorithm names (default: all)")
+    bench.add_argument("--selections", type=_name_list(SELECTION_ALGORITHMS), default=[],
+                       help="sort suite: comma separated selection operations to add")
+    bench.add_argument("--k", type=int, default=100, help="sort suite: k for the selection operations")
+    bench.add_argument("--workers", type=_int_list, default=[1],
+                       help="sort suite: comma separated worker counts for Parallel Merge Sort")
+    bench.add_argument("--distributions", type=_name_list(DISTRIBUTIONS), default=["uniform"],
+                       help="sort suite: comma separated input distributions")
+    bench.add_argument("--seed", type=int, default=None,
+                       help=f"sort suite: seed for the generated inputs (default: {DEFAULT_CACHE_SEED} "
+                            "with the dataset cache, else random)")
+    bench.add_argument("--count-ops", action="store_true",
+                       help="sort suite: also count comparisons, writes, allocations and depth")
+    bench.add_argument("--plot-counts", action="store_true",
+                       help="sort suite: add a comparison count chart with n log n and n^2 references")
+    bench.add_argument("--budget", type=float, default=None,
+                       help="sort suite: seconds per cell; cells predicted to take longer are skipped "
+                            "and extrapolated from the fitted growth rate")
+    bench.add_argument("--jobs", type=int, default=1,
+                       help="sort suite: run the cells of each size in this many worker processes")
+    bench.add_argument("--buffers", action="store_true",
+                       help="sort suite: sort array('q') buffers in place through sort_buffer instead of list copies")
+    bench.add_argument("--isolate", action="store_true",
+                       help="sort suite: run every series in a worker process of its own")
+    bench.add_argument("--pin-cpus", action="store_true",
+                       help="sort suite: pin each worker process to one cpu (Linux); Parallel Merge Sort "
+                            "pools started inside a pinned worker share its cpu")
+    bench.add_argument("--no-cache", action="store_true",
+                       help="sort suite: generate the inputs instead of using the dataset cache")
+    bench.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                       help="sort suite: dataset cache directory (default: %(default)s)")
+    bench.add_argument("--cache-mb", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                       help="sort suite: dataset cache size limit in MiB (default: %(default)g)")
+    bench.add_argument("--lists", type=int, default=BATCH_LISTS,
+                       help="batch suite: lists per batch, --sizes are the list lengths")
+    bench.add_argument("--memory", action="store_true",
+                       help="sort and structures suites: also measure peak memory with tracemalloc, "
+                            "and the per-element footprint of each structure")
+    bench.add_argument("--json", metavar="PATH", help="write results as JSON")
+    bench.add_argument("--csv", metavar="PATH", help="write results as CSV")
+    bench.add_argument("--png", metavar="PATH", help="render the charts to a PNG file")
+    bench.add_argument("--quiet", action="store_true", help="do not print progress")
+    bench.add_argument("--history", metavar="PATH", default=history.DEFAULT_HISTORY_PATH,
+                       help="JSON-lines file the run is stored in (default: %(default)s)")
+    bench.add_argument("--no-history", action="store_true", help="do not store the run")
+    bench.add_argument("--label", default="", help="free text stored with the run")
+    bench.add_argument("--baseline", metavar="ID", type=_run_id,
+                       help="stored run id, or 'latest' for the previous run of this suite, to compare "
+                            "against; the exit code is 1 when a cell regressed")
+    bench.add_argument("--threshold", type=float, default=history.DEFAULT_THRESHOLD,
+                       help="relative slowdown of a median that counts as a regression (default: %(default)s)")
+    runs = commands.add_parser("history", help="list stored runs")
+    runs.add_argument("--history", metavar="PATH", default=history.DEFAULT_HISTORY_PATH)
+    runs.add_argument("--suite", choices=list(RUNNERS))
+    return parser
+
+
+def main(argv=None):
+    # entry point of python -m benchmarks
+    args = build_parser().parse_args(argv)
+    if args.command == "history":
+        for run in history.load_runs(args.history, args.suite):
+            print(history.describe(run))
+        return 0
+    progress = (lambda line: None) if args.quiet else print
+    # the baseline is looked up before this run is stored, so 'latest' means the previous run
+    baseline = None
+    if args.baseline:
+        baseline = history.find_run(args.baseline, args.history, args.suite)
+        if baseline is None:
+            print(f"no stored {args.suite} run {args.baseline!r} in {args.history}", file=sys.stderr)
+            return 2
+    if args.suite == "sort":
+        results = run_sort_benchmark(args.sizes, args.runs, args.algorithms, workers=args.workers,
+                                     k=args.k, selections=args.selections, count_ops=args.count_ops,
+                                     plot_counts=args.plot_counts, warmup=args.warmup,
+                                     distributions=args.distributions, seed=args.seed,
+                                     measure_memory=args.memory, budget=args.budget, jobs=args.jobs,
+                                     isolate=args.isolate, pin_cpus=args.pin_cpus,
+                                     datasets=None if args.no_cache else DatasetCache(
+                                         args.cache_dir, int(args.cache_mb * 2**20)),
+                                     buffers=args.buffers, progress=progress)
+    elif args.suite == "hash":
+        results = run_hash_benchmark(args.sizes, args.runs, warmup=args.warmup, progress=progress)
+    elif args.suite == "batch":
+        results = run_batch_benchmark(args.sizes, args.runs, lists=args.lists, warmup=args.warmup,
+                                      seed=args.seed, progress=progress)
+    else:
+        results = run_structure_benchmark(args.sizes, args.runs, warmup=args.warmup,
+                                          measure_memory=args.memory, progress=progress)
+    if args.json:
+        save_json(results, args.json)
+    if args.csv:
+        save_csv(results, args.csv)
+    if not args.no_history:
+        progress(f"\nstored as run #{history.save_run(results, args.history, args.label)['id']}")
+    regressions = []
+    if baseline is not None:
+        cells = history.compare(baseline["results"], results, args.threshold)
+        regressions = [cell for cell in cells if cell["regressed"]]
+        print(f"\ncompared with baseline {history.describe(baseline)}")
+        print("\n".join(history.format_comparison(cells, args.threshold)))
+    if args.png:
+        save_png(results, args.png, baseline["results"] if baseline else None, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# on-disk cache of benchmark inputs: every (distribution, size, seed, index) input is generated
+# once, stored as a raw int64 file and memory-mapped back as a fresh list for each algorithm,
+# so all algorithms sort identical data and repeated runs skip the generation
+import mmap
+import os
+import tempfile
+from array import array
+
+from workloads import generate
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "algorithm-platform-datasets")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# bump when a generator in workloads changes, so stale files are not reused
+DATASET_VERSION = 1
+# seed of cached runs that do not choose one, so repeated runs hit the same files instead of
+# filling the cache with inputs no later run asks for
+DEFAULT_CACHE_SEED = 42
+
+
+class DatasetCache:
+    # datasets are files in directory, evicted least recently used first once they take up
+    # more than max_bytes; plain attributes only, so a cache can be handed to worker processes
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, distribution, size, seed, index=0):
+        # file holding one dataset
+        name = f"v{DATASET_VERSION}-{distribution.replace(' ', '_')}-{size}-{seed}-{index}.bin"
+        return os.path.join(self.directory, name)
+
+    def get(self, distribution, size, seed, index=0):
+        # a fresh list with the dataset, generated and stored on first use;
+        # unseeded inputs cannot be reproduced and are never cached
+        if seed is None:
+            return generate(distribution, size, seed, index)
+        path = self.path(distribution, size, seed, index)
+        try:
+            data = self.load(path)
+            os.utime(path)  # mark as recently used
+            return data
+        except FileNotFoundError:
+            pass
+        data = generate(distribution, size, seed, index)
+        self.store(path, data)
+        return data
+
+    @staticmethod
+    def load(path):
+        # read a dataset file through a memory map
+        values = array('q')
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    values.frombytes(mapped)
+        return values.tolist()
+
+    def store(self, path, data):
+        # write a dataset atomically, so concurrent workers never read half a file, then evict
+        try:
+            values = array('q', data)
+        except OverflowError:
+            return  # not int64 data, leave it uncached
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            values.tofile(file)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def entries(self):
+        # (last use, bytes, path) of every cached dataset
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".bin"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # evicted by another process meanwhile
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def total_bytes(self):
+        # bytes taken up by the cached datasets
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        # remove the least recently used datasets until the cache fits in max_bytes
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # in use or already gone
+            total -= size
+
+    def clear(self):
+        # remove every cached dataset
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
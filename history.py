@@ -0,0 +1,109 @@
+# persisted benchmark history: every run is appended to a JSON-lines file together with the
+# machine and python it ran on, and any two runs can be compared cell by cell for regressions
+import datetime
+import json
+import os
+import platform
+from importlib import metadata
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_history.jsonl")
+# a cell regresses when its median is this much slower than the baseline median
+DEFAULT_THRESHOLD = 0.10
+
+
+def package_version(name):
+    # installed version of a distribution, None when it is not installed
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def machine_info():
+    # where a run was measured, stored next to its results
+    return {
+        "node": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": package_version("numpy"),
+    }
+
+
+def load_runs(path=DEFAULT_HISTORY_PATH, benchmark=None):
+    # every stored run, oldest first, optionally only those of one benchmark suite
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        runs = [json.loads(line) for line in file if line.strip()]
+    return [run for run in runs if benchmark is None or run["results"]["benchmark"] == benchmark]
+
+
+def save_run(results, path=DEFAULT_HISTORY_PATH, label=""):
+    # append a result document to the history and return the stored run
+    runs = load_runs(path)
+    run = {
+        "id": max((r["id"] for r in runs), default=0) + 1,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "label": label,
+        "machine": machine_info(),
+        "results": results,
+    }
+    with open(path, 'a') as file:
+        file.write(json.dumps(run) + "\n")
+    return run
+
+
+def find_run(run_id, path=DEFAULT_HISTORY_PATH, benchmark=None):
+    # a stored run by id, or the most recent one for "latest"; None when there is no such run
+    runs = load_runs(path, benchmark)
+    if run_id == "latest":
+        return runs[-1] if runs else None
+    return next((run for run in runs if run["id"] == int(run_id)), None)
+
+
+def describe(run):
+    # one-line summary of a stored run for lists and reports
+    results = run["results"]
+    extra = f", {', '.join(results['distributions'])}" if "distributions" in results else ""
+    label = f" {run['label']}" if run["label"] else ""
+    return (f"#{run['id']} {run['timestamp']} {results['benchmark']}{extra} "
+            f"sizes {','.join(map(str, results['sizes']))} python {run['machine']['python']}{label}")
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    # cell by cell comparison of two result documents; only measured cells of timed panels,
+    # series and sizes present in both are compared, ratio is current / baseline median
+    cells = []
+    baseline_panels = {panel["title"]: panel for panel in baseline["panels"]}
+    for panel in current["panels"]:
+        base = baseline_panels.get(panel["title"])
+        if base is None or not any(panel["stats"].values()):
+            continue
+        for label, values in panel["series"].items():
+            base_values = {size: value for size, value, cell in zip(
+                baseline["sizes"], base["series"].get(label, []), base["stats"].get(label, []))
+                if not cell.get("extrapolated")}
+            for size, value, cell in zip(current["sizes"], values, panel["stats"][label]):
+                if base_values.get(size) and not cell.get("extrapolated"):
+                    ratio = value / base_values[size]
+                    cells.append({"panel": panel["title"], "series": label, "size": size,
+                                  "baseline": base_values[size], "current": value, "ratio": ratio,
+                                  "regressed": ratio > 1 + threshold})
+    return cells
+
+
+def format_comparison(cells, threshold=DEFAULT_THRESHOLD):
+    # report lines for compare() output, regressions first
+    if not cells:
+        return ["no cells in common with the baseline"]
+    regressed = [cell for cell in cells if cell["regressed"]]
+    lines = [f"{len(regressed)} of {len(cells)} cells regressed by more than {threshold:.0%}"]
+    for cell in sorted(cells, key=lambda cell: not cell["regressed"]):
+        flag = "REGRESSED" if cell["regressed"] else "ok"
+        lines.append(f"{flag:9} {cell['panel']} | {cell['series']} | size {cell['size']}: "
+                     f"{cell['baseline']:.6g} -> {cell['current']:.6g} ({cell['ratio']:.2f}x)")
+    return lines
@@ -0,0 +1,55 @@
+# memory measurement for the benchmarks: peak traced memory and surviving memory blocks of one
+# operation with tracemalloc, and the deep size of a data structure
+import gc
+import sys
+import tracemalloc
+import types
+
+# shared objects that are not part of any one structure's footprint
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def trace_operation(op, state=None):
+    # peak traced bytes while op(state) runs, plus the number and total size of the blocks it
+    # allocated that are still alive afterwards (its result included); state is built before
+    # tracing starts so only the operation itself is measured. surviving blocks are not an
+    # allocation count, temporaries freed before op returns do not show up in them. allocations
+    # made in other processes (Parallel Merge Sort workers) are not seen by tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = op(state)
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        del result
+    finally:
+        tracemalloc.stop()
+    statistics = snapshot.statistics("filename")
+    return {
+        "peak": peak,
+        "surviving_blocks": sum(stat.count for stat in statistics),
+        "surviving_bytes": sum(stat.size for stat in statistics),
+    }
+
+
+def deep_sizeof(obj):
+    # bytes of obj and of everything reachable from it, each object counted once;
+    # iterative, so long linked lists do not hit the recursion limit
+    seen = set()
+    pending = [obj]
+    total = 0
+    while pending:
+        current = pending.pop()
+        if current is None or isinstance(current, SHARED_TYPES) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        pending.extend(gc.get_referents(current))
+    return total
+
+
+def format_memory(stats):
+    # one-line report of trace_operation() output
+    return (f"peak {stats['peak'] / 1024:.1f} KiB, {stats['surviving_blocks']} surviving blocks "
+            f"({stats['surviving_bytes'] / 1024:.1f} KiB)")
@@ -0,0 +1,98 @@
+# timing core for the benchmarks: perf_counter_ns samples with warmup, timeit-style
+# calibration of the inner loop count, GC kept out of the timed region, and summary statistics
+import gc
+import math
+import statistics
+import time
+
+DEFAULT_WARMUP = 1
+# calibration doubles the inner loop count until one sample takes at least this long
+MIN_SAMPLE_NS = 200_000
+# two-sided 95% student t quantiles by degrees of freedom, 1.96 beyond the table
+T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+        9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+
+def sample_ns(op, setup=None, number=1):
+    # one sample: build state = setup(number) untimed, then time number calls of op(state)
+    # with the GC collected beforehand and disabled while the clock runs
+    state = setup(number) if setup is not None else None
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            op(state)
+        return time.perf_counter_ns() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def calibrate(op, setup=None, max_number=None, min_sample_ns=MIN_SAMPLE_NS):
+    # inner loop count that makes one sample last at least min_sample_ns, capped at max_number
+    number = 1
+    while max_number is None or number < max_number:
+        if sample_ns(op, setup, number) >= min_sample_ns:
+            return number
+        number *= 2
+    return max(1, max_number)
+
+
+def time_operation(op, setup=None, runs=10, warmup=DEFAULT_WARMUP, number=None, max_number=None):
+    # per-call times in seconds of op(state), one per run, plus the inner loop count used;
+    # number is calibrated when None, max_number caps it for operations that use up their state
+    if number is None:
+        number = calibrate(op, setup, max_number)
+    for _ in range(warmup):
+        sample_ns(op, setup, number)
+    times = [sample_ns(op, setup, number) / number / 1e9 for _ in range(runs)]
+    return times, number
+
+
+def summarize(times, number=1):
+    # median, p95, mean, stddev and a distribution-free 95% confidence interval for the median
+    ordered = sorted(times)
+    n = len(ordered)
+    half_width = 0.98 * math.sqrt(n)  # 1.96 * sqrt(n) / 2 ranks either side of the middle
+    low_rank = max(1, math.floor(n / 2 - half_width))
+    high_rank = min(n, math.ceil(n / 2 + half_width))
+    stdev = statistics.stdev(ordered) if n > 1 else 0.0
+    mean = statistics.fmean(ordered)
+    t = T_95[max(df for df in T_95 if df <= n - 1)] if 1 < n <= 31 else 1.96
+    margin = t * stdev / math.sqrt(n)
+    return {
+        "median": statistics.median(ordered),
+        "p95": ordered[math.ceil(0.95 * n) - 1],
+        "mean": mean,
+        "stdev": stdev,
+        "ci_low": ordered[low_rank - 1],
+        "ci_high": ordered[high_rank - 1],
+        "mean_ci_low": mean - margin,
+        "mean_ci_high": mean + margin,
+        "runs": n,
+        "number": number,
+    }
+
+
+def fit_power_law(sizes, times):
+    # least squares fit of times = coefficient * size ** exponent on a log-log scale,
+    # returns (exponent, coefficient), or None with fewer than two distinct positive sizes
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    exponent = (sum((x - mean_x) * (y - mean_y) for x, y in points)
+                / sum((x - mean_x) ** 2 for x, _ in points))
+    return exponent, math.exp(mean_y - exponent * mean_x)
+
+
+def format_stats(stats, scale=1.0, unit="sec", digits=6):
+    # one-line report of summarize() output, values multiplied by scale
+    def fmt(value):
+        return f"{value * scale:.{digits}f}"
+    return (f"median {fmt(stats['median'])} {unit} (p95 {fmt(stats['p95'])}, sd {fmt(stats['stdev'])}, "
+            f"95% CI {fmt(stats['ci_low'])}-{fmt(stats['ci_high'])}, "
+            f"{stats['runs']}x{stats['number']} loops)")
@@ -0,0 +1,95 @@
+# input distributions for the sorting benchmarks; every generator draws from the random.Random
+# it is given, so a seed reproduces exactly the same inputs
+import random
+
+# value range used by the uniform based distributions, as in the original benchmark
+VALUE_RANGE_FACTOR = 10
+# nearly sorted inputs get one random swap per this many elements
+NEARLY_SORTED_SWAP_EVERY = 100
+FEW_UNIQUE_VALUES = 8
+ZIPF_EXPONENT = 1.2
+OUTLIER_FRACTION = 0.01
+
+
+def uniform(size, rng):
+    # independent uniform integers in 1..size*10
+    return [rng.randint(1, size * VALUE_RANGE_FACTOR) for _ in range(size)]
+
+
+def sorted_input(size, rng):
+    # uniform values, already ascending
+    return sorted(uniform(size, rng))
+
+
+def reversed_input(size, rng):
+    # uniform values, descending
+    return sorted(uniform(size, rng), reverse=True)
+
+
+def nearly_sorted(size, rng):
+    # ascending values with k = size/100 random pairs swapped
+    data = sorted_input(size, rng)
+    for _ in range(max(1, size // NEARLY_SORTED_SWAP_EVERY) if size > 1 else 0):
+        i, j = rng.randrange(size), rng.randrange(size)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def few_unique(size, rng):
+    # only a handful of distinct values
+    return [rng.randint(1, FEW_UNIQUE_VALUES) for _ in range(size)]
+
+
+def organ_pipe(size, rng):
+    # ascending first half followed by a descending second half
+    data = sorted(uniform(size, rng))
+    return data[0::2] + data[1::2][::-1]
+
+
+def sawtooth(size, rng):
+    # ascending teeth of about sqrt(size) elements each
+    data = uniform(size, rng)
+    tooth = max(2, int(size ** 0.5))
+    for start in range(0, size, tooth):
+        data[start:start + tooth] = sorted(data[start:start + tooth])
+    return data
+
+
+def zipfian(size, rng):
+    # ranks 1..size drawn with zipf probabilities, a few values dominate
+    ranks = range(1, size + 1)
+    weights = [1 / rank ** ZIPF_EXPONENT for rank in ranks]
+    return rng.choices(ranks, weights=weights, k=size)
+
+
+def wide_range_outliers(size, rng):
+    # small values with 1% outliers up to 10**12, the worst case for counting sort
+    data = [rng.randint(1, 100) for _ in range(size)]
+    for _ in range(max(1, int(size * OUTLIER_FRACTION)) if size else 0):
+        data[rng.randrange(size)] = rng.randint(1, 10 ** 12)
+    return data
+
+
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "sorted": sorted_input,
+    "reversed": reversed_input,
+    "nearly sorted": nearly_sorted,
+    "few unique": few_unique,
+    "organ pipe": organ_pipe,
+    "sawtooth": sawtooth,
+    "zipfian": zipfian,
+    "outliers": wide_range_outliers,
+}
+
+
+def make_rng(seed, distribution, size, index=0):
+    # random generator for the index-th input of a (distribution, size) cell, None means unseeded
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}:{distribution}:{size}:{index}")
+
+
+def generate(distribution, size, seed=None, index=0):
+    # the index-th input of the given distribution and size, reproducible from seed
+    return DISTRIBUTIONS[distribution](size, make_rng(seed, distribution, size, index))